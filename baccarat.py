@@ -1,9 +1,14 @@
 import random
-import time
-import os
 from typing import List, Tuple
 from colorama import init, Fore, Back, Style
 
+import card_core
+from event_log import BACCARAT, DEAL, EventLog, SETTLE
+from game_engine import check_bets
+from history import History
+from streaming_stats import StreamingStats
+from terminal import clear_screen, pause
+
 init(autoreset=True)
 
 CARD_TEMPLATE = """
@@ -24,49 +29,97 @@ CARD_BACK = """
 │░░░░░░░░░│
 └─────────┘"""
 
-class Card:
-    def __init__(self, suit: str, value: str):
-        self.suit = suit
-        self.value = value
-        
+CARD_ART = card_core.CardArt(CARD_TEMPLATE, CARD_BACK)
+
+NUMERIC_VALUES = [0 if value in ['J', 'Q', 'K', '10'] else 1 if value == 'A' else int(value)
+                  for value in card_core.VALUES]
+# Baccarat value bucket for each card code
+BUCKETS = [NUMERIC_VALUES[code >> 2] for code in range(52)]
+
+class Card(card_core.Card):
+    __slots__ = ()
+    
     def get_numeric_value(self) -> int:
-        if self.value in ['J', 'Q', 'K', '10']:
-            return 0
-        elif self.value == 'A':
-            return 1
-        return int(self.value)
-        
-    def __str__(self):
-        return f"{self.value} of {self.suit}"
+        return NUMERIC_VALUES[self.code >> 2]
     
-    def get_symbol(self) -> str:
-        symbols = {'Hearts': '♥', 'Diamonds': '♦', 'Clubs': '♣', 'Spades': '♠'}
-        return symbols[self.suit]
+    def display(self) -> str:
+        return '\n'.join(CARD_ART.rows(self.code))
+
+CARDS = [Card.from_code(code) for code in range(52)]
+
+class Shoe:
+    def __init__(self, num_decks: int = 8, penetration: float = 0.75, rng: random.Random = None):
+        # The cut card has to sit inside the shoe or play runs off the end of it
+        if not 0 < penetration < 1:
+            raise ValueError(f"Penetration must be between 0 and 1: {penetration}")
+        self.num_decks = num_decks
+        self.penetration = penetration
+        self.rng = rng or random
+        self.cards = card_core.new_deck(num_decks)
+        self.shuffle()
     
-    def get_color(self) -> str:
-        return Fore.RED if self.suit in ['Hearts', 'Diamonds'] else Fore.WHITE
+    def shuffle(self):
+        self.rng.shuffle(self.cards)
+        self.position = 0
+        self.cut_card = int(len(self.cards) * self.penetration)
+        self.counts = [16 * self.num_decks] + [4 * self.num_decks] * 9
     
-    def display(self) -> str:
-        color = self.get_color()
-        symbol = self.get_symbol()
-        val = self.value.ljust(2)
-        return color + CARD_TEMPLATE.format(val, symbol, val) + Style.RESET_ALL
-
-class Deck:
-    def __init__(self):
-        suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-        values = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
-        self.cards = [Card(suit, value) for suit in suits for value in values]
-        random.shuffle(self.cards)
+    @property
+    def needs_shuffle(self) -> bool:
+        return self.position >= self.cut_card
+    
+    def composition(self) -> Tuple[int, ...]:
+        return tuple(self.counts)
+    
+    def __len__(self) -> int:
+        return len(self.cards) - self.position
     
     def draw(self) -> Card:
-        return self.cards.pop()
+        code = self.cards[self.position]
+        self.position += 1
+        self.counts[BUCKETS[code]] -= 1
+        return CARDS[code]
+
+def player_draws(score: int) -> bool:
+    return score < 6
+
+def banker_draws(score: int, player_third: int = None) -> bool:
+    if score < 3:
+        return True
+    if score >= 7:
+        return False
+    
+    if score == 3 and player_third != 8:
+        return True
+    if score == 4 and player_third in [2, 3, 4, 5, 6, 7]:
+        return True
+    if score == 5 and player_third in [4, 5, 6, 7]:
+        return True
+    if score == 6 and player_third in [6, 7]:
+        return True
+    return False
+
+WINNERS = ['player', 'banker', 'tie']
+
+def payout(bet_on: str, winner: str) -> float:
+    # Net multiplier for a bet; ties lose player and banker bets
+    if winner != bet_on:
+        return -1
+    if bet_on == 'banker':
+        return 0.95  # 5% commission on banker wins
+    if bet_on == 'tie':
+        return 8
+    return 1
 
 class Baccarat:
-    def __init__(self):
-        self.deck = Deck()
-        self.history = []
+    def __init__(self, rng: random.Random = None, num_decks: int = 8, penetration: float = 0.75,
+                 history: History = None, live_stats: StreamingStats = None, events: EventLog = None):
+        self.rng = rng
+        self.events = events
+        self.deck = Shoe(num_decks, penetration, rng)
+        self.history = history if history is not None else History({'winner': 'B', 'player_score': 'B', 'banker_score': 'B'})
         self.stats = {'player_wins': 0, 'banker_wins': 0, 'ties': 0}
+        self.live_stats = live_stats or StreamingStats()
         
     def calculate_hand(self, cards: List[Card]) -> int:
         return sum(card.get_numeric_value() for card in cards) % 10
@@ -75,23 +128,9 @@ class Baccarat:
         score = self.calculate_hand(hand)
         
         if is_player:
-            return score < 6
+            return player_draws(score)
         else:
-            if score < 3:
-                return True
-            if score >= 7:
-                return False
-            
-            player_third = banker_score
-            if score == 3 and player_third != 8:
-                return True
-            if score == 4 and player_third in [2, 3, 4, 5, 6, 7]:
-                return True
-            if score == 5 and player_third in [4, 5, 6, 7]:
-                return True
-            if score == 6 and player_third in [6, 7]:
-                return True
-            return False
+            return banker_draws(score, banker_score)
 
     def deal_initial_cards(self) -> Tuple[List[Card], List[Card]]:
         player_hand = [self.deck.draw(), self.deck.draw()]
@@ -100,26 +139,21 @@ class Baccarat:
 
     def display_hands(self, player_hand: List[Card], banker_hand: List[Card], hide_player_second: bool = False):
         print("\n" + Fore.CYAN + "Banker's Hand:" + Style.RESET_ALL)
-        banker_cards = [card.display().split('\n') for card in banker_hand]
-        for i in range(len(banker_cards[0])):
-            print(''.join(card[i] for card in banker_cards))
+        print(CARD_ART.join([CARD_ART.rows(card.code) for card in banker_hand], ''))
             
         print("\n" + Fore.GREEN + "Player's Hand:" + Style.RESET_ALL)
         if hide_player_second:
-            player_cards = [player_hand[0].display().split('\n')]
-            player_cards.append(CARD_BACK.split('\n'))
+            player_cards = [CARD_ART.rows(player_hand[0].code), CARD_ART.back]
         else:
-            player_cards = [card.display().split('\n') for card in player_hand]
-        
-        for i in range(len(player_cards[0])):
-            print(''.join(card[i] for card in player_cards))
+            player_cards = [CARD_ART.rows(card.code) for card in player_hand]
+        print(CARD_ART.join(player_cards, ''))
 
     def play_game(self, bet_on: str, player_hand: List[Card], banker_hand: List[Card]) -> Tuple[str, int]:
         player_score = self.calculate_hand(player_hand)
         banker_score = self.calculate_hand(banker_hand)
         
         print("\n" + Fore.YELLOW + "Revealing all cards..." + Style.RESET_ALL)
-        time.sleep(1)
+        pause(1)
         self.display_hands(player_hand, banker_hand, hide_player_second=False)
         
         if player_score >= 8 or banker_score >= 8:
@@ -130,7 +164,7 @@ class Baccarat:
             player_third_card = None
             if self.should_draw_third_card(player_hand, True):
                 print(Fore.GREEN + "\nPlayer draws third card..." + Style.RESET_ALL)
-                time.sleep(1)
+                pause(1)
                 player_hand.append(self.deck.draw())
                 player_third_card = player_hand[-1].get_numeric_value()
                 player_score = self.calculate_hand(player_hand)
@@ -138,7 +172,7 @@ class Baccarat:
             
             if self.should_draw_third_card(banker_hand, False, player_third_card):
                 print(Fore.CYAN + "\nBanker draws third card..." + Style.RESET_ALL)
-                time.sleep(1)
+                pause(1)
                 banker_hand.append(self.deck.draw())
                 banker_score = self.calculate_hand(banker_hand)
                 self.display_hands(player_hand, banker_hand)
@@ -149,6 +183,35 @@ class Baccarat:
         print(f"\n{Fore.GREEN}Player Score: {final_player}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Banker Score: {final_banker}{Style.RESET_ALL}")
         
+        winner, winnings = self.settle(bet_on, final_player, final_banker)
+        self.history.append(WINNERS.index(winner), final_player, final_banker)
+        return winner, winnings
+
+    def play_headless(self, bet_on: str = None, record_history: bool = False) -> Tuple[str, int]:
+        # Same drawing rules as play_game, without display or delays, and
+        # without history unless asked; with no bet_on the coup is just played out
+        if self.deck.needs_shuffle:
+            self.deck.shuffle()
+        player_hand, banker_hand = self.deal_initial_cards()
+        player_score = self.calculate_hand(player_hand)
+        banker_score = self.calculate_hand(banker_hand)
+        
+        if player_score < 8 and banker_score < 8:
+            player_third_card = None
+            if self.should_draw_third_card(player_hand, True):
+                player_hand.append(self.deck.draw())
+                player_third_card = player_hand[-1].get_numeric_value()
+                player_score = self.calculate_hand(player_hand)
+            if self.should_draw_third_card(banker_hand, False, player_third_card):
+                banker_hand.append(self.deck.draw())
+                banker_score = self.calculate_hand(banker_hand)
+        
+        winner, winnings = self.settle(bet_on, player_score, banker_score)
+        if record_history:
+            self.history.append(WINNERS.index(winner), player_score, banker_score)
+        return winner, winnings
+
+    def settle(self, bet_on: str, final_player: int, final_banker: int) -> Tuple[str, int]:
         if final_player > final_banker:
             winner = 'player'
             self.stats['player_wins'] += 1
@@ -158,22 +221,50 @@ class Baccarat:
         else:
             winner = 'tie'
             self.stats['ties'] += 1
-            
-        winnings = -1
-        if winner == bet_on:
-            if bet_on == 'banker':
-                winnings = 0.95  # 5% commission on banker wins
-            elif bet_on == 'tie':
-                winnings = 8
-            else:
-                winnings = 1
-                
-        self.history.append({'winner': winner, 'player_score': final_player, 'banker_score': final_banker})
-        return winner, winnings
+        self.live_stats.record_outcome(winner)
+        if self.events:
+            self.events.record(DEAL, BACCARAT, WINNERS.index(winner) * 100 + final_player * 10 + final_banker)
+        return winner, payout(bet_on, winner)
+
+class BaccaratEngine:
+    """GameEngine adapter: player, banker and tie bets settle against one coup."""
+    
+    name = 'baccarat'
+    
+    def __init__(self, rng: random.Random = None, num_decks: int = 8, events: EventLog = None):
+        self.game = Baccarat(rng, num_decks, events=events)
+        self.reset()
+    
+    def reset(self):
+        self.bets = []
+        self.winner = None
+    
+    def place_bets(self, bets: list):
+        self.bets.extend(check_bets(bets, WINNERS))
+    
+    def step(self, action=None) -> str:
+        self.winner, _ = self.game.play_headless(record_history=True)
+        return self.winner
+    
+    def settle(self) -> list:
+        game = self.game
+        nets = []
+        for bet_on, _, amount in self.bets:
+            net = amount * payout(bet_on, self.winner)
+            game.live_stats.record_payout(net)
+            if game.events:
+                game.events.record(SETTLE, BACCARAT, WINNERS.index(self.winner), amount, net)
+            nets.append(net)
+        self.bets = []
+        return nets
+    
+    def snapshot(self) -> dict:
+        return {'game': self.name, 'winner': self.winner, 'bets': list(self.bets),
+                'stats': dict(self.game.stats), 'cards_left': len(self.game.deck)}
 
 def main():
     # Clear console
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
     
     print(Fore.YELLOW + """
     ╔══════════════════════════════════════╗
@@ -192,14 +283,14 @@ def main():
             
             if len(game.history) > 0:
                 print("\nLast 5 results:", ' '.join([
-                    Fore.GREEN + 'P' if h['winner'] == 'player' else
-                    Fore.CYAN + 'B' if h['winner'] == 'banker' else
-                    Fore.YELLOW + 'T' for h in game.history[-5:]
+                    Fore.GREEN + 'P' if WINNERS[winner] == 'player' else
+                    Fore.CYAN + 'B' if WINNERS[winner] == 'banker' else
+                    Fore.YELLOW + 'T' for winner, _, _ in game.history.last(5)
                 ]) + Style.RESET_ALL)
             
             player_hand, banker_hand = game.deal_initial_cards()
             print(Fore.CYAN + "\nDealing cards..." + Style.RESET_ALL)
-            time.sleep(1)
+            pause(1)
             game.display_hands(player_hand, banker_hand, hide_player_second=True)
             
             while True:
@@ -226,6 +317,9 @@ def main():
             winner, multiplier = game.play_game(choice, player_hand, banker_hand)
             winnings = bet * multiplier
             balance += winnings
+            game.live_stats.record_payout(winnings)
+            if game.events:
+                game.events.record(SETTLE, BACCARAT, WINNERS.index(winner), bet, winnings)
             
             print(f"\nWinner: {winner}")
             if multiplier > 0:
@@ -233,10 +327,10 @@ def main():
             else:
                 print(f"You lost ${bet}!")
                 
-            if len(game.deck.cards) < 6:
-                print(Fore.YELLOW + "\n🔄 Shuffling new deck..." + Style.RESET_ALL)
-                time.sleep(1)
-                game = Baccarat()
+            if game.deck.needs_shuffle:
+                print(Fore.YELLOW + "\n🔄 Cut card reached, shuffling the shoe..." + Style.RESET_ALL)
+                pause(1)
+                game.deck.shuffle()
                 
     except KeyboardInterrupt:
         print("\nGame interrupted by user.")
@@ -0,0 +1,110 @@
+import functools
+from typing import Iterable, Tuple
+
+from baccarat import Card, banker_draws, player_draws
+
+# Composition vectors count the remaining cards by baccarat value:
+# index 0 holds 10/J/Q/K, index 1 aces, and so on up to 9.
+FULL_DECK = (16, 4, 4, 4, 4, 4, 4, 4, 4, 4)
+
+PLAYER_DRAWS = [player_draws(score) for score in range(10)]
+# Last column is "player stood" (no third card)
+BANKER_DRAWS = [[banker_draws(score, third) for third in range(10)] + [banker_draws(score, None)]
+                for score in range(10)]
+
+def composition(cards: Iterable[Card]) -> Tuple[int, ...]:
+    counts = [0] * 10
+    for card in cards:
+        counts[card.get_numeric_value()] += 1
+    return tuple(counts)
+
+def _pairs(counts: list, total: int):
+    # Unordered two-card draws by value, with their probability
+    pairs = total * (total - 1)
+    for i in range(10):
+        ci = counts[i]
+        if not ci:
+            continue
+        if ci > 1:
+            yield i, i, ci * (ci - 1) / pairs
+        for j in range(i + 1, 10):
+            if counts[j]:
+                yield i, j, 2 * ci * counts[j] / pairs
+
+@functools.lru_cache(maxsize=4096)
+def outcome_probabilities(shoe: Tuple[int, ...]) -> Tuple[float, float, float]:
+    """Exact (player, banker, tie) probabilities for the next hand from `shoe`."""
+    counts = list(shoe)
+    total = sum(counts)
+    if total < 6:
+        raise ValueError("Shoe needs at least 6 cards to deal a hand")
+    player = banker = tie = 0.0
+
+    for p1, p2, p_prob in _pairs(counts, total):
+        counts[p1] -= 1
+        counts[p2] -= 1
+        for b1, b2, b_prob in _pairs(counts, total - 2):
+            weight = p_prob * b_prob
+            player_score = (p1 + p2) % 10
+            banker_score = (b1 + b2) % 10
+            counts[b1] -= 1
+            counts[b2] -= 1
+            left = total - 4
+
+            if player_score >= 8 or banker_score >= 8 or (
+                    not PLAYER_DRAWS[player_score] and not BANKER_DRAWS[banker_score][10]):
+                # Nobody draws
+                outcomes = ((player_score, banker_score, 1.0),)
+            elif not PLAYER_DRAWS[player_score]:
+                # Only the banker draws
+                outcomes = [(player_score, (banker_score + b3) % 10, counts[b3] / left)
+                            for b3 in range(10) if counts[b3]]
+            else:
+                outcomes = []
+                for p3 in range(10):
+                    if not counts[p3]:
+                        continue
+                    p3_prob = counts[p3] / left
+                    final_player = (player_score + p3) % 10
+                    if not BANKER_DRAWS[banker_score][p3]:
+                        outcomes.append((final_player, banker_score, p3_prob))
+                        continue
+                    counts[p3] -= 1
+                    for b3 in range(10):
+                        if counts[b3]:
+                            outcomes.append((final_player, (banker_score + b3) % 10,
+                                             p3_prob * counts[b3] / (left - 1)))
+                    counts[p3] += 1
+
+            for final_player, final_banker, prob in outcomes:
+                if final_player > final_banker:
+                    player += weight * prob
+                elif final_banker > final_player:
+                    banker += weight * prob
+                else:
+                    tie += weight * prob
+            counts[b1] += 1
+            counts[b2] += 1
+        counts[p1] += 1
+        counts[p2] += 1
+
+    return player, banker, tie
+
+def expected_values(shoe: Tuple[int, ...]) -> dict:
+    # Per-unit EV of each bet, using the payouts in Baccarat.settle
+    player, banker, tie = outcome_probabilities(shoe)
+    return {
+        'player': player - banker - tie,
+        'banker': 0.95 * banker - player - tie,
+        'tie': 8 * tie - player - banker,
+    }
+
+def main():
+    for name, shoe in (('1 deck', FULL_DECK), ('8 decks', tuple(c * 8 for c in FULL_DECK))):
+        player, banker, tie = outcome_probabilities(shoe)
+        evs = expected_values(shoe)
+        print(f"{name}: player {player:.4%}  banker {banker:.4%}  tie {tie:.4%}")
+        print("  EV " + "  ".join(f"{bet} {ev:+.4%}" for bet, ev in evs.items()))
+
+if __name__ == "__main__":
+    main()
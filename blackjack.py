@@ -1,8 +1,11 @@
 import random
-import time
-import os
 from colorama import init, Fore, Style
 
+import card_core
+from event_log import BLACKJACK, DEAL, EventLog, SETTLE, STEP
+from streaming_stats import StreamingStats
+from terminal import clear_screen, pause
+
 init(autoreset=True)
 
 CARD_TEMPLATE = """
@@ -14,109 +17,102 @@ CARD_TEMPLATE = """
 │      {} │
 └─────────┘"""
 
-class Card:
-    def __init__(self, suit: str, value: str):
-        self.suit = suit
-        self.value = value
-        
-    def get_numeric_value(self) -> list:
-        if self.value in ['J', 'Q', 'K']:
-            return [10]
-        elif self.value == 'A':
-            return [1, 11]
-        return [int(self.value)]
-        
-    def get_symbol(self) -> str:
-        symbols = {'Hearts': '♥', 'Diamonds': '♦', 'Clubs': '♣', 'Spades': '♠'}
-        return symbols[self.suit]
-    
-    def get_color(self) -> str:
-        return Fore.RED if self.suit in ['Hearts', 'Diamonds'] else Fore.WHITE
-    
-    def display(self, hidden: bool = False) -> str:
-        if hidden:
-            return Fore.BLUE + """
+CARD_BACK = """
 ┌─────────┐
 │░░░░░░░░░│
 │░░░░░░░░░│
 │░░░░░░░░░│
 │░░░░░░░░░│
 │░░░░░░░░░│
-└─────────┘""" + Style.RESET_ALL
-        
-        color = self.get_color()
-        symbol = self.get_symbol()
-        val = self.value.ljust(2)
-        return color + CARD_TEMPLATE.format(val, symbol, val) + Style.RESET_ALL
+└─────────┘"""
+
+CARD_ART = card_core.CardArt(CARD_TEMPLATE, CARD_BACK, Fore.BLUE)
+
+NUMERIC_VALUES = [[10] if value in ['J', 'Q', 'K'] else [1, 11] if value == 'A' else [int(value)]
+                  for value in card_core.VALUES]
+HARD_VALUES = [values[0] for values in NUMERIC_VALUES]  # Aces count 1
+ACE = card_core.VALUES.index('A')
+
+class Card(card_core.Card):
+    __slots__ = ()
+    
+    def get_numeric_value(self) -> list:
+        return NUMERIC_VALUES[self.code >> 2]
+    
+    def display(self, hidden: bool = False) -> str:
+        return '\n'.join(CARD_ART.back if hidden else CARD_ART.rows(self.code))
+
+CARDS = [Card.from_code(code) for code in range(52)]
 
 class Deck:
-    def __init__(self, num_decks: int = 6):
-        suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-        values = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
-        self.cards = [Card(suit, value) for _ in range(num_decks) 
-                     for suit in suits for value in values]
+    def __init__(self, num_decks: int = 6, rng: random.Random = None, verbose: bool = True):
+        self.num_decks = num_decks
+        self.rng = rng or random
+        self.verbose = verbose
+        self.cards = card_core.new_deck(num_decks)
         self.shuffle()
     
     def shuffle(self):
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
+    
+    def composition(self) -> tuple:
+        # Remaining cards counted by hard value: index 0 is aces, index 9 tens and faces
+        counts = [0] * 10
+        for code in self.cards:
+            counts[HARD_VALUES[code >> 2] - 1] += 1
+        return tuple(counts)
     
     def draw(self) -> Card:
         if len(self.cards) < 20:  # Reshuffle when low on cards
-            print(f"{Fore.YELLOW}Shuffling new deck...{Style.RESET_ALL}")
-            self.__init__()
-        return self.cards.pop()
+            if self.verbose:
+                print(f"{Fore.YELLOW}Shuffling new deck...{Style.RESET_ALL}")
+            self.__init__(self.num_decks, self.rng, self.verbose)
+        return CARDS[self.cards.pop()]
 
 class Hand:
+    __slots__ = ('cards', 'hard_total', 'has_ace')
+    
     def __init__(self):
         self.cards = []
+        self.hard_total = 0
+        self.has_ace = False
     
     def add_card(self, card: Card):
         self.cards.append(card)
+        rank = card.code >> 2
+        self.hard_total += HARD_VALUES[rank]
+        if rank == ACE:
+            self.has_ace = True
     
     def get_value(self) -> int:
-        values = [0]
-        for card in self.cards:
-            new_values = []
-            for card_value in card.get_numeric_value():
-                for value in values:
-                    new_values.append(value + card_value)
-            values = new_values
-        
-        valid_values = [v for v in values if v <= 21]
-        return max(valid_values) if valid_values else min(values)
+        # At most one ace can ever count as 11 without busting
+        if self.has_ace and self.hard_total <= 11:
+            return self.hard_total + 10
+        return self.hard_total
+    
+    def is_soft(self) -> bool:
+        return self.has_ace and self.hard_total <= 11
     
     def is_blackjack(self) -> bool:
         return len(self.cards) == 2 and self.get_value() == 21
     
     def is_bust(self) -> bool:
-        return self.get_value() > 21
+        return self.hard_total > 21
     
     def display(self, hide_first: bool = False):
-        cards_display = [card.display(hidden=(hide_first and i == 0)) 
-                        for i, card in enumerate(self.cards)]
-        
-        # Split each card's display into lines
-        card_lines = [card.split('\n') for card in cards_display]
-        
-        # Filter out empty lines and ensure all lines are present
-        card_lines = [[line for line in card if line.strip()] for card in card_lines]
-        
-        # Combine lines from all cards
-        result = []
-        if card_lines:
-            for i in range(len(card_lines[0])):
-                line = ''
-                for card in card_lines:
-                    if i < len(card):
-                        line += card[i] + ' '
-                result.append(line)
-        
-        return '\n'.join(result)
+        return CARD_ART.join([CARD_ART.back if hide_first and i == 0 else CARD_ART.rows(card.code)
+                              for i, card in enumerate(self.cards)])
+
+# Settlement outcome codes in the event log
+RESULTS = ['player', 'blackjack', 'push', 'dealer']
 
 class Blackjack:
-    def __init__(self):
-        self.deck = Deck()
+    def __init__(self, num_decks: int = 6, rng: random.Random = None, verbose: bool = True,
+                 live_stats: StreamingStats = None, events: EventLog = None):
+        self.deck = Deck(num_decks, rng, verbose)
+        self.events = events
         self.stats = {'games': 0, 'wins': 0, 'pushes': 0, 'blackjacks': 0}
+        self.live_stats = live_stats or StreamingStats()
     
     def deal_initial_cards(self) -> tuple:
         player_hand = Hand()
@@ -127,10 +123,14 @@ class Blackjack:
         player_hand.add_card(self.deck.draw())
         dealer_hand.add_card(self.deck.draw())
         
+        if self.events:
+            # The four card codes, one byte each in dealing order; the dealer's first card is the hole card
+            first, second = player_hand.cards
+            hole, up = dealer_hand.cards
+            self.events.record(DEAL, BLACKJACK, first.code | hole.code << 8 | second.code << 16 | up.code << 24)
         return player_hand, dealer_hand
     
-    def play_round(self, player_hand: Hand, dealer_hand: Hand, bet: int) -> tuple:
-        # Check for initial blackjacks
+    def check_blackjacks(self, player_hand: Hand, dealer_hand: Hand, bet: int) -> tuple:
         if player_hand.is_blackjack() and dealer_hand.is_blackjack():
             return 'push', bet
         elif player_hand.is_blackjack():
@@ -138,6 +138,29 @@ class Blackjack:
             return 'blackjack', bet * 2.5
         elif dealer_hand.is_blackjack():
             return 'dealer', 0
+        return None
+    
+    def dealer_should_hit(self, dealer_hand: Hand) -> bool:
+        return dealer_hand.get_value() < 17
+    
+    def settle(self, player_hand: Hand, dealer_hand: Hand, bet: int) -> tuple:
+        player_value = player_hand.get_value()
+        dealer_value = dealer_hand.get_value()
+        
+        if dealer_hand.is_bust():
+            return 'player', bet * 2
+        elif player_value > dealer_value:
+            return 'player', bet * 2
+        elif dealer_value > player_value:
+            return 'dealer', 0
+        else:
+            return 'push', bet
+    
+    def play_round(self, player_hand: Hand, dealer_hand: Hand, bet: int) -> tuple:
+        # Check for initial blackjacks
+        natural = self.check_blackjacks(player_hand, dealer_hand, bet)
+        if natural:
+            return natural
         
         # Player's turn
         while True:
@@ -157,28 +180,18 @@ class Blackjack:
         # Dealer's turn
         print(f"\n{Fore.CYAN}Dealer reveals cards:{Style.RESET_ALL}")
         print(dealer_hand.display())
-        time.sleep(1)
+        pause(1)
         
-        while dealer_hand.get_value() < 17:
+        while self.dealer_should_hit(dealer_hand):
             print(f"\n{Fore.CYAN}Dealer hits...{Style.RESET_ALL}")
             dealer_hand.add_card(self.deck.draw())
             print(dealer_hand.display())
-            time.sleep(1)
+            pause(1)
         
-        player_value = player_hand.get_value()
-        dealer_value = dealer_hand.get_value()
-        
-        if dealer_hand.is_bust():
-            return 'player', bet * 2
-        elif player_value > dealer_value:
-            return 'player', bet * 2
-        elif dealer_value > player_value:
-            return 'dealer', 0
-        else:
-            return 'push', bet
+        return self.settle(player_hand, dealer_hand, bet)
 
 def main():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
     print(Fore.YELLOW + """
     ╔════════════════════════════════╗
     ║          BLACKJACK             ║
@@ -225,6 +238,11 @@ def main():
                 print(f"\n{Fore.RED}Dealer wins! You lose ${bet}!{Style.RESET_ALL}")
             
             balance += winnings
+            game.live_stats.record_outcome(result)
+            game.live_stats.record_payout(winnings - bet)
+            if game.events:
+                game.events.record(STEP, BLACKJACK, RESULTS.index(result))
+                game.events.record(SETTLE, BLACKJACK, RESULTS.index(result), bet, winnings - bet)
             
     except KeyboardInterrupt:
         print("\nCashing out...")
@@ -0,0 +1,70 @@
+import argparse
+import random
+import time
+
+import card_core
+from blackjack import ACE, CARDS, Hand
+
+def enumerated_value(cards: list) -> int:
+    # The original Hand.get_value: every ace-combination total, best one under 22
+    values = [0]
+    for card in cards:
+        values = [value + card_value for card_value in card.get_numeric_value() for value in values]
+    valid_values = [v for v in values if v <= 21]
+    return max(valid_values) if valid_values else min(values)
+
+def ace_rich_shoe(num_decks: int, extra_ace_decks: int, rng: random.Random) -> list:
+    # num_decks full decks plus the aces of extra_ace_decks more, shuffled
+    codes = list(card_core.new_deck(num_decks))
+    codes += [ACE << 2 | suit for suit in range(4)] * extra_ace_decks
+    rng.shuffle(codes)
+    return [CARDS[code] for code in codes]
+
+def deal_hands(count: int, shoe: list, rng: random.Random) -> list:
+    return [rng.sample(shoe, rng.randint(2, 8)) for _ in range(count)]
+
+def time_enumerated(hands: list) -> tuple:
+    results = []
+    start = time.perf_counter()
+    for cards in hands:
+        dealt = []
+        for card in cards:
+            dealt.append(card)
+            value = enumerated_value(dealt)
+            results.append((value, value > 21))
+    return time.perf_counter() - start, results
+
+def time_incremental(hands: list) -> tuple:
+    results = []
+    start = time.perf_counter()
+    for cards in hands:
+        hand = Hand()
+        for card in cards:
+            hand.add_card(card)
+            results.append((hand.get_value(), hand.is_bust()))
+    return time.perf_counter() - start, results
+
+def main():
+    parser = argparse.ArgumentParser(description="Time incremental blackjack hand totals against ace enumeration")
+    parser.add_argument('--hands', type=int, default=100_000)
+    parser.add_argument('--decks', type=int, default=8)
+    parser.add_argument('--extra-ace-decks', type=int, default=60,
+                        help="Extra decks' worth of aces added to the shoe")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    shoe = ace_rich_shoe(args.decks, args.extra_ace_decks, rng)
+    aces = sum(card.code >> 2 == ACE for card in shoe) / len(shoe)
+    hands = deal_hands(args.hands, shoe, rng)
+
+    # Value and bust are re-evaluated after every card, as the game and the dealer loop do
+    old_time, old_results = time_enumerated(hands)
+    new_time, new_results = time_incremental(hands)
+    print(f"{args.hands:,} hands of 2-8 cards, {args.decks}-deck shoe with {aces:.0%} aces")
+    print(f"  Enumerated aces:    {old_time:.2f}s")
+    print(f"  Incremental totals: {new_time:.2f}s ({old_time / new_time:.1f}x)")
+    print(f"  Results match:      {old_results == new_results}")
+
+if __name__ == "__main__":
+    main()
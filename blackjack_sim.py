@@ -0,0 +1,138 @@
+import argparse
+import random
+import time
+
+from blackjack import RESULTS, Blackjack, Card, Hand
+from blackjack_strategy import StrategyPolicy, full_shoe, solve
+from event_log import BLACKJACK, SETTLE, STEP
+from game_engine import check_bets
+from game_rng import GameRNG
+from sim_stats import SimulationResult
+
+class StandOnPolicy:
+    """Hits until the hand reaches `threshold`, like the dealer does at 17."""
+
+    def __init__(self, threshold: int = 17):
+        self.threshold = threshold
+
+    def decide(self, hand: Hand, dealer_upcard: Card) -> str:
+        return 'hit' if hand.get_value() < self.threshold else 'stand'
+
+class BlackjackSimulator:
+    def __init__(self, policy=None, num_decks: int = 6, rng: random.Random = None):
+        self.policy = policy or StandOnPolicy()
+        self.game = Blackjack(num_decks, rng or random.Random(), verbose=False)
+
+    def play_round(self) -> tuple:
+        game = self.game
+        draw = game.deck.draw
+        player_hand, dealer_hand = game.deal_initial_cards()
+
+        natural = game.check_blackjacks(player_hand, dealer_hand, 1)
+        if natural:
+            return natural
+
+        upcard = dealer_hand.cards[1]  # cards[0] is the hole card
+        while self.policy.decide(player_hand, upcard) == 'hit':
+            player_hand.add_card(draw())
+            if player_hand.is_bust():
+                return 'dealer', 0
+
+        while game.dealer_should_hit(dealer_hand):
+            dealer_hand.add_card(draw())
+
+        return game.settle(player_hand, dealer_hand, 1)
+
+    def run(self, rounds: int) -> SimulationResult:
+        result = SimulationResult()
+        play_round = self.play_round
+        record = result.record
+        for _ in range(rounds):
+            outcome, returned = play_round()
+            record(outcome, returned - 1)
+        return result
+
+class BlackjackEngine:
+    """GameEngine adapter: one hand per step, played by `policy` (standing
+    on 17 by default); every bet rides on that hand."""
+
+    name = 'blackjack'
+
+    def __init__(self, rng: random.Random = None, num_decks: int = 6, policy=None, events=None):
+        self.simulator = BlackjackSimulator(policy, num_decks, rng)
+        self.game = self.simulator.game
+        self.game.events = events
+        self.reset()
+
+    def reset(self):
+        self.bets = []
+        self.result = None
+        self.returned = 0
+
+    def place_bets(self, bets: list):
+        self.bets.extend(check_bets(bets, ('hand',)))
+
+    def step(self, action=None) -> str:
+        game = self.game
+        self.result, self.returned = self.simulator.play_round()
+        game.stats['games'] += 1
+        if self.result in ('player', 'blackjack'):
+            game.stats['wins'] += 1
+        elif self.result == 'push':
+            game.stats['pushes'] += 1
+        game.live_stats.record_outcome(self.result)
+        if game.events:
+            # One per round, however many bets ride on it
+            game.events.record(STEP, BLACKJACK, RESULTS.index(self.result))
+        return self.result
+
+    def settle(self) -> list:
+        # play_round returns what a unit bet gets back, stake included
+        game = self.game
+        nets = []
+        for _, _, amount in self.bets:
+            net = amount * (self.returned - 1)
+            game.live_stats.record_payout(net)
+            if game.events:
+                game.events.record(SETTLE, BLACKJACK, RESULTS.index(self.result), amount, net)
+            nets.append(net)
+        self.bets = []
+        return nets
+
+    def snapshot(self) -> dict:
+        return {'game': self.name, 'result': self.result, 'bets': list(self.bets),
+                'stats': dict(self.game.stats)}
+
+def simulate(rounds: int, policy=None, num_decks: int = 6, seed: int = None) -> SimulationResult:
+    return BlackjackSimulator(policy, num_decks, GameRNG(seed)).run(rounds)
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless blackjack house edge simulator")
+    parser.add_argument('--rounds', type=int, default=1_000_000)
+    parser.add_argument('--decks', type=int, default=6)
+    parser.add_argument('--stand-on', type=int, default=17)
+    parser.add_argument('--basic-strategy', action='store_true',
+                        help="Play the solved hit/stand strategy instead of --stand-on")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    if args.basic_strategy:
+        policy = StrategyPolicy(solve(full_shoe(args.decks)))
+    else:
+        policy = StandOnPolicy(args.stand_on)
+
+    start = time.perf_counter()
+    result = simulate(args.rounds, policy, args.decks, args.seed)
+    elapsed = time.perf_counter() - start
+
+    low, high = result.confidence_interval()
+    print(f"Rounds:      {result.rounds:,} in {elapsed:.1f}s "
+          f"({result.rounds / elapsed * 60:,.0f} hands/min)")
+    print(f"Wins:        {result.rate('player'):.4%}")
+    print(f"Blackjacks:  {result.rate('blackjack'):.4%}")
+    print(f"Pushes:      {result.rate('push'):.4%}")
+    print(f"Losses:      {result.rate('dealer'):.4%}")
+    print(f"House edge:  {result.house_edge:.4%} (95% CI {low:.4%} .. {high:.4%})")
+
+if __name__ == "__main__":
+    main()
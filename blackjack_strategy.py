@@ -0,0 +1,168 @@
+import argparse
+import functools
+import json
+import time
+
+from blackjack import HARD_VALUES, Card, Deck, Hand
+
+# Dealer final totals tracked by the solver; index 5 is a bust
+DEALER_TOTALS = (17, 18, 19, 20, 21)
+BUST = 5
+
+def full_shoe(num_decks: int) -> tuple:
+    # Card counts by hard value, aces first, tens and faces last
+    return tuple([4 * num_decks] * 9 + [16 * num_decks])
+
+def _add(total: int, soft: bool, value: int) -> tuple:
+    total += value
+    if soft and total > 21:
+        return total - 10, False
+    if not soft and value == 1 and total <= 11:
+        return total + 10, True
+    return total, soft
+
+@functools.lru_cache(maxsize=None)
+def dealer_outcomes(shoe: tuple, upcard: int, hit_soft_17: bool = False) -> tuple:
+    """P(dealer ends on 17..21, bust) for an upcard, given no dealer blackjack.
+
+    Cards are removed from `shoe` as the dealer draws, so the result is
+    exact for that composition. `shoe` should already exclude the upcard.
+    """
+
+    @functools.lru_cache(maxsize=None)
+    def play(counts: tuple, total: int, soft: bool, peeked: bool) -> tuple:
+        if total > 21:
+            return (0.0,) * BUST + (1.0,)
+        if total >= 17 and not (hit_soft_17 and soft and total == 17):
+            return tuple(1.0 if total == final else 0.0 for final in DEALER_TOTALS) + (0.0,)
+
+        # The hole card can't complete a blackjack, since naturals are settled first
+        excluded = 0
+        if not peeked and total in (10, 11):
+            excluded = 1 if total == 10 else 10
+        remaining = sum(counts) - (counts[excluded - 1] if excluded else 0)
+
+        result = [0.0] * (BUST + 1)
+        for value in range(1, 11):
+            count = counts[value - 1]
+            if not count or value == excluded:
+                continue
+            drawn = counts[:value - 1] + (count - 1,) + counts[value:]
+            for i, p in enumerate(play(drawn, *_add(total, soft, value), True)):
+                result[i] += p * count / remaining
+        return tuple(result)
+
+    total, soft = _add(0, False, upcard)
+    return play(shoe, total, soft, False)
+
+class StrategyTable:
+    """Hit/stand decisions indexed by [soft][player total][dealer upcard]."""
+
+    def __init__(self, actions: list, expected: list):
+        self.actions = actions
+        self.expected = expected
+
+    def action(self, total: int, soft: bool, upcard: int) -> str:
+        return self.actions[soft][total][upcard]
+
+    def as_dict(self) -> dict:
+        return {
+            ('soft' if soft else 'hard', total, upcard): self.actions[soft][total][upcard]
+            for soft in (False, True)
+            for total in range(4, 22)
+            for upcard in range(1, 11)
+            if self.actions[soft][total][upcard] is not None
+        }
+
+    def save(self, path: str):
+        rows = {}
+        for (kind, total, upcard), action in self.as_dict().items():
+            rows.setdefault(kind, {}).setdefault(str(total), {})[str(upcard)] = action
+        with open(path, 'w') as f:
+            json.dump(rows, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> 'StrategyTable':
+        with open(path) as f:
+            rows = json.load(f)
+        actions = [[[None] * 11 for _ in range(22)] for _ in range(2)]
+        for kind, totals in rows.items():
+            for total, upcards in totals.items():
+                for upcard, action in upcards.items():
+                    actions[kind == 'soft'][int(total)][int(upcard)] = action
+        return cls(actions, None)
+
+def solve(shoe: tuple, hit_soft_17: bool = False) -> StrategyTable:
+    """Best hit/stand play for every (total, soft, upcard) against `shoe`.
+
+    The dealer's draws are exact for the composition; the player's draws
+    use the composition minus the upcard, ignoring the player's own cards.
+    """
+    actions = [[[None] * 11 for _ in range(22)] for _ in range(2)]
+    expected = [[[None] * 11 for _ in range(22)] for _ in range(2)]
+
+    for upcard in range(1, 11):
+        if not shoe[upcard - 1]:
+            continue
+        counts = shoe[:upcard - 1] + (shoe[upcard - 1] - 1,) + shoe[upcard:]
+        dealer = dealer_outcomes(counts, upcard, hit_soft_17)
+        draw_odds = [count / sum(counts) for count in counts]
+
+        def stand(total: int) -> float:
+            win = dealer[BUST] + sum(p for final, p in zip(DEALER_TOTALS, dealer) if final < total)
+            lose = sum(p for final, p in zip(DEALER_TOTALS, dealer) if final > total)
+            return win - lose
+
+        @functools.lru_cache(maxsize=None)
+        def best(total: int, soft: bool) -> float:
+            hit = 0.0
+            for value in range(1, 11):
+                new_total, new_soft = _add(total, soft, value)
+                hit += draw_odds[value - 1] * (-1.0 if new_total > 21 else best(new_total, new_soft))
+            standing = stand(total)
+            actions[soft][total][upcard] = 'hit' if hit > standing else 'stand'
+            expected[soft][total][upcard] = max(hit, standing)
+            return max(hit, standing)
+
+        for total in range(4, 22):
+            best(total, False)
+        for total in range(12, 22):
+            best(total, True)
+
+    return StrategyTable(actions, expected)
+
+def solve_for_deck(deck: Deck, hit_soft_17: bool = False) -> StrategyTable:
+    return solve(deck.composition(), hit_soft_17)
+
+class StrategyPolicy:
+    """Headless player policy that looks every decision up in a StrategyTable."""
+
+    def __init__(self, table: StrategyTable):
+        self.actions = table.actions
+
+    def decide(self, hand: Hand, dealer_upcard: Card) -> str:
+        return self.actions[hand.is_soft()][hand.get_value()][HARD_VALUES[dealer_upcard.code >> 2]]
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve blackjack hit/stand strategy")
+    parser.add_argument('--decks', type=int, default=6)
+    parser.add_argument('--hit-soft-17', action='store_true')
+    parser.add_argument('--save', help="Write the table as JSON to this path")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    table = solve(full_shoe(args.decks), args.hit_soft_17)
+    print(f"Solved {args.decks}-deck strategy in {time.perf_counter() - start:.2f}s")
+
+    header = ' '.join(f"{'A' if up == 1 else up:>2}" for up in range(1, 11))
+    for soft, totals in ((False, range(8, 22)), (True, range(13, 22))):
+        print(f"\n{'Soft' if soft else 'Hard':>4}  {header}")
+        for total in totals:
+            row = ' '.join(f"{table.action(total, soft, up)[0].upper():>2}" for up in range(1, 11))
+            print(f"{total:>4}  {row}")
+
+    if args.save:
+        table.save(args.save)
+
+if __name__ == "__main__":
+    main()
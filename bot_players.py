@@ -0,0 +1,274 @@
+import argparse
+import os
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import game_engine
+from game_rng import GameRNG
+
+def bet_menu(game: str) -> list:
+    # Every (bet_type, bet_value) a bot can put on the layout of `game`
+    if game == 'roulette':
+        from roulette import layout_bets
+        return layout_bets()
+    if game == 'sic_bo':
+        from sic_bo import BETS
+        menu = [(bet, None) for bet in BETS if bet not in ('total', 'single')]
+        menu += [('total', total) for total in BETS['total']['payout']]
+        menu += [('single', face) for face in range(1, 7)]
+        return menu
+    if game == 'baccarat':
+        from baccarat import WINNERS
+        return [(winner, None) for winner in WINNERS]
+    if game in ('blackjack', 'pai_gow'):
+        return [('hand', None)]
+    if game == 'slots':
+        return [('spin', None)]
+    raise ValueError(f"No bot bets for game: {game}")
+
+TABLE_LIMIT = 512  # Largest stake a martingale bot may place
+
+MENUS = {}  # Bet menus by game, shared by every RandomBet in the process
+
+# The bet flat and martingale bots keep making, by game
+DEFAULT_BETS = {
+    'roulette': ('red', None),
+    'sic_bo': ('small', None),
+    'baccarat': ('banker', None),
+    'blackjack': ('hand', None),
+    'pai_gow': ('hand', None),
+    'slots': ('spin', None),
+}
+
+class FlatBet:
+    """The same bet for the same amount every round."""
+
+    def __init__(self, game: str, unit: float = 1, rng=None):
+        self.bet_type, self.bet_value = DEFAULT_BETS[game]
+        self.unit = unit
+
+    def wager(self, balance: float) -> list:
+        if balance < self.unit:
+            return []
+        return [(self.bet_type, self.bet_value, self.unit)]
+
+    def update(self, net: float):
+        pass
+
+class Martingale(FlatBet):
+    """Doubles the stake after every losing round, keeps it on a push and
+    drops back to one unit after a win, until the table limit or the
+    bankroll stops it."""
+
+    def __init__(self, game: str, unit: float = 1, rng=None, limit: float = TABLE_LIMIT):
+        super().__init__(game, unit)
+        self.limit = limit
+        self.stake = unit
+
+    def wager(self, balance: float) -> list:
+        if balance < self.unit:
+            return []
+        return [(self.bet_type, self.bet_value, min(self.stake, self.limit, balance))]
+
+    def update(self, net: float):
+        if net < 0:
+            self.stake *= 2
+        elif net > 0:
+            self.stake = self.unit
+
+class RandomBet(FlatBet):
+    """One unit on a bet drawn uniformly from everything the layout offers."""
+
+    def __init__(self, game: str, unit: float = 1, rng=None):
+        super().__init__(game, unit)
+        if game not in MENUS:
+            MENUS[game] = bet_menu(game)
+        self.menu = MENUS[game]
+        self.choice = rng.choice
+
+    def wager(self, balance: float) -> list:
+        if balance < self.unit:
+            return []
+        bet_type, bet_value = self.choice(self.menu)
+        return [(bet_type, bet_value, self.unit)]
+
+STRATEGIES = {
+    'flat': FlatBet,
+    'martingale': Martingale,
+    'random': RandomBet,
+}
+
+class Bot:
+    """A simulated player with its own engine, bankroll and strategy."""
+
+    __slots__ = ('engine', 'strategy', 'balance')
+
+    def __init__(self, engine, strategy, balance: float):
+        self.engine = engine
+        self.strategy = strategy
+        self.balance = balance
+
+    def play_round(self) -> float:
+        # Returns the net of the round, or None once the bot can't cover a bet
+        bets = self.strategy.wager(self.balance)
+        if not bets:
+            return None
+        engine = self.engine
+        engine.place_bets(bets)
+        engine.step()
+        net = sum(engine.settle())
+        self.balance += net
+        self.strategy.update(net)
+        return net
+
+class LoadResult:
+    def __init__(self):
+        self.sessions = 0
+        self.rounds = 0
+        self.busted = 0
+        self.net = 0.0
+        self.session_bytes = 0               # Traced allocations of the sessions after their first round
+        self.latencies = np.empty(0)         # Seconds from placing bets to settlement, per round
+
+    def merge(self, other: 'LoadResult') -> 'LoadResult':
+        self.sessions += other.sessions
+        self.rounds += other.rounds
+        self.busted += other.busted
+        self.net += other.net
+        self.session_bytes += other.session_bytes
+        self.latencies = np.concatenate([self.latencies, other.latencies])
+        return self
+
+    def percentile(self, p: float) -> float:
+        return float(np.percentile(self.latencies, p)) if len(self.latencies) else 0.0
+
+_shared = {}  # Per-process state every bot's engine can share, built on first use
+
+def engine_options(game: str, options: dict) -> dict:
+    if game == 'pai_gow':
+        if 'house_way' not in _shared:
+            from pai_gow_house_way import HouseWay
+            _shared['house_way'] = HouseWay()
+        return {'house_way': _shared['house_way']}
+    if game != 'blackjack':
+        return {}
+    decks = options.get('decks', 6)
+    stand_on = options.get('stand_on')
+    if stand_on:
+        from blackjack_sim import StandOnPolicy
+        return {'num_decks': decks, 'policy': StandOnPolicy(stand_on)}
+    if ('policy', decks) not in _shared:
+        from blackjack_strategy import StrategyPolicy, full_shoe, solve
+        _shared['policy', decks] = StrategyPolicy(solve(full_shoe(decks)))
+    return {'num_decks': decks, 'policy': _shared['policy', decks]}
+
+def _run_shard(task: tuple) -> LoadResult:
+    game, players, rounds, strategy, balance, sequence, options = task
+    result = LoadResult()
+    extra = engine_options(game, options)
+    game_engine.load(game)
+    make_strategy = STRATEGIES[strategy]
+    settings = {'limit': options.get('limit', TABLE_LIMIT)} if strategy == 'martingale' else {}
+    unit = options.get('unit', 1)
+
+    # The first round is played under tracemalloc as well, so buffers the
+    # games only allocate once they are in play are counted
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    bots = []
+    for rng in GameRNG(sequence).spawn(players):
+        engine = game_engine.create(game, rng=rng, **extra)
+        bots.append(Bot(engine, make_strategy(game, unit, rng, **settings), balance))
+    active = [bot for bot in bots if bot.play_round() is not None]
+    first_round = len(active)
+    result.session_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    latencies = np.empty(players * max(rounds - 1, 0))
+    count = 0
+    clock = time.perf_counter
+    # Players take turns a round at a time, as they would sharing a server
+    for _ in range(rounds - 1):
+        still_in = []
+        for bot in active:
+            start = clock()
+            net = bot.play_round()
+            if net is None:
+                continue
+            latencies[count] = clock() - start
+            count += 1
+            still_in.append(bot)
+        active = still_in
+        if not active:
+            break
+
+    result.sessions = players
+    result.rounds = count + first_round
+    result.busted = players - len(active)
+    result.net = sum(bot.balance for bot in bots) - players * balance
+    result.latencies = latencies[:count]
+    return result
+
+def run(game: str, players: int, rounds: int, strategy: str = 'flat', balance: float = 1000,
+        workers: int = None, seed: int = None, shard_players: int = 1000, **options) -> LoadResult:
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    if players < 1 or rounds < 1:
+        raise ValueError("Need at least one player and one round")
+    if game not in DEFAULT_BETS:
+        raise ValueError(f"No bot bets for game: {game}")
+    shards = [shard_players] * (players // shard_players)
+    if players % shard_players:
+        shards.append(players % shard_players)
+    streams = GameRNG(seed).sequence.spawn(len(shards))
+    tasks = [(game, shard, rounds, strategy, balance, stream, options)
+             for shard, stream in zip(shards, streams)]
+
+    result = LoadResult()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for task in tasks:
+            result.merge(_run_shard(task))
+        return result
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for shard_result in pool.map(_run_shard, tasks):
+            result.merge(shard_result)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive simulated players against the games to measure load")
+    parser.add_argument('game', choices=sorted(DEFAULT_BETS))
+    parser.add_argument('--players', type=int, default=5000)
+    parser.add_argument('--rounds', type=int, default=100, help="Rounds each player plays unless busted")
+    parser.add_argument('--strategy', choices=sorted(STRATEGIES), default='flat')
+    parser.add_argument('--unit', type=float, default=1, help="Base bet")
+    parser.add_argument('--limit', type=float, default=TABLE_LIMIT, help="Largest martingale stake")
+    parser.add_argument('--balance', type=float, default=1000, help="Starting bankroll per player")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--decks', type=int, default=6)
+    parser.add_argument('--stand-on', type=int, default=None,
+                        help="Blackjack bots stand on this total instead of playing basic strategy")
+    args = parser.parse_args()
+    if args.players < 1 or args.rounds < 1:
+        parser.error("--players and --rounds must be at least 1")
+
+    options = {'unit': args.unit, 'limit': args.limit, 'decks': args.decks, 'stand_on': args.stand_on}
+    start = time.perf_counter()
+    result = run(args.game, args.players, args.rounds, args.strategy, args.balance,
+                 args.workers, args.seed, **options)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.game}, {args.strategy} bets: {result.sessions:,} players, {result.rounds:,} rounds "
+          f"in {elapsed:.1f}s ({result.rounds / elapsed:,.0f} rounds/s)")
+    print(f"  Settlement latency: p50 {result.percentile(50) * 1e6:.1f}us, "
+          f"p99 {result.percentile(99) * 1e6:.1f}us")
+    print(f"  Memory per session: {result.session_bytes / result.sessions / 1024:.1f} KiB")
+    print(f"  Busted players:     {result.busted:,} ({result.busted / result.sessions:.1%})")
+    print(f"  Net to players:     {result.net:+,.0f} ({result.net / max(result.rounds, 1):+.4f} per round)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+from array import array
+
+from colorama import Fore, Style
+
+# A card is one small int: value index * 4 + suit index, so 0-51 for one deck
+SUITS = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
+VALUES = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+
+SUIT_SYMBOLS = ['♥', '♦', '♣', '♠']
+SUIT_COLORS = [Fore.RED, Fore.RED, Fore.WHITE, Fore.WHITE]
+
+_SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+_VALUE_INDEX = {value: i for i, value in enumerate(VALUES)}
+
+def encode(suit: str, value: str) -> int:
+    return _VALUE_INDEX[value] * 4 + _SUIT_INDEX[suit]
+
+def new_deck(num_decks: int = 1) -> array:
+    return array('B', range(52)) * num_decks
+
+class Card:
+    """Read-only view of a card code; games subclass it to add their own values."""
+
+    __slots__ = ('code',)
+
+    def __init__(self, suit: str, value: str):
+        self.code = encode(suit, value)
+
+    @classmethod
+    def from_code(cls, code: int) -> 'Card':
+        card = cls.__new__(cls)
+        card.code = code
+        return card
+
+    @property
+    def suit(self) -> str:
+        return SUITS[self.code & 3]
+
+    @property
+    def value(self) -> str:
+        return VALUES[self.code >> 2]
+
+    def get_symbol(self) -> str:
+        return SUIT_SYMBOLS[self.code & 3]
+
+    def get_color(self) -> str:
+        return SUIT_COLORS[self.code & 3]
+
+    def __str__(self):
+        return f"{self.value} of {self.suit}"
+
+class CardArt:
+    """Colored text rows for all 52 faces and the back of one card template.
+
+    Rows are built once, on first use, so hands render by joining cached
+    rows instead of formatting the template for every card on every frame.
+    """
+
+    def __init__(self, template: str, back: str = None, back_color: str = ''):
+        self.template = template
+        self.back = back and [back_color + row + Style.RESET_ALL for row in back.strip('\n').split('\n')]
+        self._faces = None
+
+    def rows(self, code: int) -> list:
+        if self._faces is None:
+            self._faces = [self._render(code) for code in range(52)]
+        return self._faces[code]
+
+    def _render(self, code: int) -> list:
+        value = VALUES[code >> 2].ljust(2)
+        face = self.template.format(value, SUIT_SYMBOLS[code & 3], value)
+        return [SUIT_COLORS[code & 3] + row + Style.RESET_ALL for row in face.strip('\n').split('\n')]
+
+    @staticmethod
+    def join(cards: list, sep: str = ' ') -> str:
+        # Row lists of several cards side by side
+        return '\n'.join(sep.join(row) for row in zip(*cards))
@@ -0,0 +1,70 @@
+import os
+import struct
+import time
+
+# Event kinds
+SPIN, ROLL, DEAL, STEP, SETTLE = range(1, 6)
+KINDS = {SPIN: 'spin', ROLL: 'roll', DEAL: 'deal', STEP: 'step', SETTLE: 'settle'}
+
+# Game ids
+BLACKJACK, BACCARAT, PAI_GOW, SIC_BO, ROULETTE, SLOTS, GLASS_BRIDGE, RUSSIAN_ROULETTE = range(8)
+GAMES = ['blackjack', 'baccarat', 'pai_gow', 'sic_bo', 'roulette', 'slots', 'glass_bridge', 'russian_roulette']
+
+# kind, game, table, outcome code, stake, net payout: 24 bytes, no padding
+RECORD = struct.Struct('<BBHidd')
+
+class EventLog:
+    """Append-only binary log of fixed-width event records.
+
+    Records are packed into a preallocated buffer and written `batch` at a
+    time. With `fsync_interval` (seconds) the file is also fsynced after a
+    write once that long has passed since the last sync; otherwise syncing
+    is left to the OS.
+    """
+
+    def __init__(self, path: str, batch: int = 8192, fsync_interval: float = None):
+        self.path = path
+        self.batch = batch
+        self.fsync_interval = fsync_interval
+        self._file = open(path, 'ab')
+        # A crash mid-write can leave a partial record at the end; drop it so
+        # new records stay aligned
+        self.count = os.path.getsize(path) // RECORD.size
+        self._file.truncate(self.count * RECORD.size)
+        self._buffer = bytearray(RECORD.size * batch)
+        self._pending = 0
+        self._synced = time.monotonic()
+
+    def record(self, kind: int, game: int, outcome: int, stake: float = 0, net: float = 0, table: int = 0):
+        RECORD.pack_into(self._buffer, self._pending * RECORD.size, kind, game, table, outcome, stake, net)
+        self._pending += 1
+        if self._pending == self.batch:
+            self.flush()
+
+    def write_records(self, data: bytes):
+        # Already-packed records, e.g. a NumPy array in event_replay.EVENT_DTYPE
+        self.flush()
+        if len(data) % RECORD.size:
+            raise ValueError(f"Record data must be a multiple of {RECORD.size} bytes")
+        self._file.write(data)
+        self.count += len(data) // RECORD.size
+        self._sync()
+
+    def flush(self):
+        if self._pending:
+            self._file.write(memoryview(self._buffer)[:self._pending * RECORD.size])
+            self.count += self._pending
+            self._pending = 0
+            self._sync()
+
+    def _sync(self):
+        if self.fsync_interval is not None and time.monotonic() - self._synced >= self.fsync_interval:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._synced = time.monotonic()
+
+    def close(self):
+        if self._file:
+            self.flush()
+            self._file.close()
+            self._file = None
@@ -0,0 +1,145 @@
+import argparse
+import os
+import time
+
+import numpy as np
+
+from event_log import (BACCARAT, BLACKJACK, DEAL, GAMES, KINDS, PAI_GOW, RECORD, ROLL, ROULETTE,
+                       SETTLE, SIC_BO, SLOTS, SPIN, STEP)
+
+# Same layout as event_log.RECORD
+EVENT_DTYPE = np.dtype([('kind', 'u1'), ('game', 'u1'), ('table', '<u2'), ('outcome', '<i4'),
+                        ('stake', '<f8'), ('net', '<f8')])
+assert EVENT_DTYPE.itemsize == RECORD.size
+
+# Outcome codes of blackjack and pai gow STEP and SETTLE events
+BLACKJACK_RESULTS = ['player', 'blackjack', 'push', 'dealer']
+PAI_GOW_RESULTS = ['win', 'push', 'lose']
+
+def read_events(path: str) -> np.ndarray:
+    # Memory-mapped, read-only view of every complete record in the log
+    count = os.path.getsize(path) // EVENT_DTYPE.itemsize
+    if count == 0:
+        return np.zeros(0, dtype=EVENT_DTYPE)
+    return np.memmap(path, dtype=EVENT_DTYPE, mode='r', shape=(count,))
+
+def iter_events(path: str, chunk: int = 1 << 20, game: int = None, table: int = None):
+    events = read_events(path)
+    for start in range(0, len(events), chunk):
+        block = events[start:start + chunk]
+        if game is not None:
+            block = block[block['game'] == game]
+        if table is not None:
+            block = block[block['table'] == table]
+        yield block
+
+def _outcomes(events: np.ndarray, kind: int) -> np.ndarray:
+    return events['outcome'][events['kind'] == kind]
+
+def _settled(events: np.ndarray) -> np.ndarray:
+    return events[events['kind'] == SETTLE]
+
+def _result_counts(events: np.ndarray, results: list) -> dict:
+    # One STEP per round; SETTLE comes once per bet, so several can share a round
+    counts = np.bincount(_outcomes(events, STEP), minlength=len(results))
+    return dict(zip(results, counts.tolist()))
+
+def _blackjack(stats: dict, events: np.ndarray):
+    counts = _result_counts(events, BLACKJACK_RESULTS)
+    stats['games'] += int(np.count_nonzero(events['kind'] == DEAL))
+    stats['wins'] += counts['player'] + counts['blackjack']
+    stats['pushes'] += counts['push']
+    stats['blackjacks'] += counts['blackjack']
+
+def _pai_gow(stats: dict, events: np.ndarray):
+    counts = _result_counts(events, PAI_GOW_RESULTS)
+    stats['games'] += sum(counts.values())
+    stats['wins'] += counts['win']
+    stats['pushes'] += counts['push']
+
+def _baccarat(stats: dict, events: np.ndarray):
+    # Deal outcome is winner * 100 + player score * 10 + banker score
+    counts = np.bincount(_outcomes(events, DEAL) // 100, minlength=3).tolist()
+    for key, count in zip(['player_wins', 'banker_wins', 'ties'], counts):
+        stats[key] += count
+
+def _roulette(stats: dict, events: np.ndarray):
+    from roulette import COLORS
+    counts = np.bincount(_outcomes(events, SPIN), minlength=37).tolist()
+    stats['spins'] += sum(counts)
+    for number, count in enumerate(counts):
+        stats[COLORS[number]] += count
+
+def _sic_bo(stats: dict, events: np.ndarray):
+    settled = _settled(events)
+    stats['rolls'] += int(np.count_nonzero(events['kind'] == ROLL))
+    stats['wins'] += int(np.count_nonzero(settled['net'] > 0))
+    if len(settled):
+        stats['biggest_win'] = max(stats['biggest_win'], float(settled['net'].max()))
+
+def _slots(stats: dict, events: np.ndarray):
+    # The machine counts gross winnings, stake included
+    settled = _settled(events)
+    won = settled['stake'] + settled['net']
+    stats['spins'] += int(np.count_nonzero(events['kind'] == SPIN))
+    stats['wins'] += int(np.count_nonzero(won > 0))
+    if len(settled):
+        stats['biggest_win'] = max(stats['biggest_win'], float(won.max()))
+
+# game -> (empty stats dict as the game builds it, reducer over a chunk of events)
+REDUCERS = {
+    BLACKJACK: ({'games': 0, 'wins': 0, 'pushes': 0, 'blackjacks': 0}, _blackjack),
+    BACCARAT: ({'player_wins': 0, 'banker_wins': 0, 'ties': 0}, _baccarat),
+    PAI_GOW: ({'games': 0, 'wins': 0, 'pushes': 0}, _pai_gow),
+    SIC_BO: ({'rolls': 0, 'wins': 0, 'biggest_win': 0}, _sic_bo),
+    ROULETTE: ({'spins': 0, 'red': 0, 'black': 0, 'green': 0}, _roulette),
+    SLOTS: ({'spins': 0, 'wins': 0, 'biggest_win': 0}, _slots),
+}
+
+def rebuild_stats(path: str, game: int, table: int = None) -> dict:
+    initial, reduce = REDUCERS[game]
+    stats = dict(initial)
+    for events in iter_events(path, game=game, table=table):
+        reduce(stats, events)
+    return stats
+
+def balance(path: str, start: float = 0, game: int = None, table: int = None) -> float:
+    total = start
+    for events in iter_events(path, game=game, table=table):
+        total += float(_settled(events)['net'].sum())
+    return total
+
+def event_counts(path: str) -> dict:
+    # (game, kind) -> number of events
+    counts = {}
+    for events in iter_events(path):
+        keys = events['game'].astype(np.int64) * 256 + events['kind']
+        values, totals = np.unique(keys, return_counts=True)
+        for key, count in zip(values.tolist(), totals.tolist()):
+            name = (GAMES[key // 256], KINDS[key % 256])
+            counts[name] = counts.get(name, 0) + count
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild stats and balances from an event log")
+    parser.add_argument('path')
+    parser.add_argument('--game', choices=GAMES)
+    parser.add_argument('--table', type=int)
+    parser.add_argument('--start-balance', type=float, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    game = GAMES.index(args.game) if args.game else None
+    counts = event_counts(args.path)
+    for (name, kind), count in sorted(counts.items()):
+        print(f"{name:18s} {kind:8s} {count:>12,}")
+    for game_id in ([game] if game is not None else REDUCERS):
+        if game_id in REDUCERS and any(name == GAMES[game_id] for name, _ in counts):
+            print(f"{GAMES[game_id]} stats: {rebuild_stats(args.path, game_id, args.table)}")
+    print(f"Balance: {balance(args.path, args.start_balance, game, args.table):,.2f}")
+    elapsed = time.perf_counter() - start
+    total = sum(counts.values())
+    print(f"Replayed {total:,} events in {elapsed:.2f}s ({total / max(elapsed, 1e-9) * 60:,.0f} events/min)")
+
+if __name__ == "__main__":
+    main()
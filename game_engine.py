@@ -0,0 +1,65 @@
+import importlib
+from typing import Protocol
+
+class GameEngine(Protocol):
+    """Headless driver shared by every game.
+
+    reset() starts a fresh round (or session, for the survival games),
+    place_bets() queues (bet_type, bet_value, amount) tuples, step()
+    advances the game by one spin, roll, deal or move and returns the
+    outcome, settle() returns the net result of each queued bet and clears
+    them, and snapshot() returns plain data describing the current state.
+    """
+
+    name: str
+
+    def reset(self) -> None: ...
+
+    def place_bets(self, bets: list) -> None: ...
+
+    def step(self, action=None): ...
+
+    def settle(self) -> list: ...
+
+    def snapshot(self) -> dict: ...
+
+def check_bets(bets: list, allowed) -> list:
+    # Validates every (bet_type, bet_value, amount) before any is accepted
+    bets = list(bets)
+    for bet_type, _, amount in bets:
+        if bet_type not in allowed:
+            raise ValueError(f"Unknown bet type: {bet_type}")
+        if amount <= 0:
+            raise ValueError(f"Bet amount must be positive: {amount}")
+    return bets
+
+# Engine classes by game, imported on first use so that loading one game
+# never pulls in the others
+ENGINES = {
+    'blackjack': 'blackjack_sim:BlackjackEngine',
+    'baccarat': 'baccarat:BaccaratEngine',
+    'pai_gow': 'pai_gow:PaiGowEngine',
+    'sic_bo': 'sic_bo:SicBoEngine',
+    'roulette': 'roulette:RouletteEngine',
+    'slots': 'slot_machine:SlotEngine',
+    'glass_bridge': 'glass_bridge:GlassBridgeEngine',
+    'russian_roulette': 'russian_roulette:RussianRouletteEngine',
+}
+
+_loaded = {}
+
+def register(name: str, path: str):
+    # path is 'module:Class'; replaces any engine already registered under name
+    ENGINES[name] = path
+    _loaded.pop(name, None)
+
+def load(name: str) -> type:
+    if name not in _loaded:
+        if name not in ENGINES:
+            raise ValueError(f"Unknown game: {name}")
+        module, cls = ENGINES[name].split(':')
+        _loaded[name] = getattr(importlib.import_module(module), cls)
+    return _loaded[name]
+
+def create(name: str, **options) -> GameEngine:
+    return load(name)(**options)
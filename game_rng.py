@@ -0,0 +1,77 @@
+import random
+from array import array
+
+import numpy as np
+
+def _seed_int(sequence: np.random.SeedSequence) -> int:
+    return int.from_bytes(sequence.generate_state(4).tobytes(), 'little')
+
+class GameRNG(random.Random):
+    """random.Random seeded from a NumPy SeedSequence.
+
+    Drop-in wherever the games take an rng. The seed (or the entropy picked
+    when none is given) is kept for audits, and spawn() derives independent,
+    reproducible substreams for tables, workers or shards.
+    """
+
+    def __init__(self, seed=None):
+        if isinstance(seed, np.random.SeedSequence):
+            self.sequence = seed
+        else:
+            self.sequence = np.random.SeedSequence(seed)
+        super().__init__(_seed_int(self.sequence))
+
+    @property
+    def entropy(self) -> int:
+        return self.sequence.entropy
+
+    def spawn(self, count: int) -> list:
+        return [GameRNG(child) for child in self.sequence.spawn(count)]
+
+    def bulk(self, block_size: int = 65536) -> 'BulkRNG':
+        return BulkRNG(self.sequence.spawn(1)[0], block_size)
+
+class BulkRNG:
+    """Same methods the games call on an rng, served one at a time from large
+    blocks pre-generated by a NumPy Generator. Vectorized engines can take
+    `generator` directly."""
+
+    def __init__(self, seed=None, block_size: int = 65536):
+        if isinstance(seed, np.random.SeedSequence):
+            self.sequence = seed
+        else:
+            self.sequence = np.random.SeedSequence(seed)
+        self.generator = np.random.default_rng(self.sequence)
+        self.block_size = block_size
+        self._blocks = {}  # kind -> iterator over the current block
+
+    def spawn(self, count: int) -> list:
+        return [BulkRNG(child, self.block_size) for child in self.sequence.spawn(count)]
+
+    def _refill(self, key, fill):
+        block = self._blocks[key] = iter(fill(self.block_size).tolist())
+        return next(block)
+
+    def random(self) -> float:
+        try:
+            return next(self._blocks['random'])
+        except (KeyError, StopIteration):
+            return self._refill('random', self.generator.random)
+
+    def randint(self, a: int, b: int) -> int:
+        try:
+            return next(self._blocks[a, b])
+        except (KeyError, StopIteration):
+            return self._refill((a, b), lambda n: self.generator.integers(a, b + 1, n))
+
+    def randrange(self, start: int, stop: int = None) -> int:
+        if stop is None:
+            start, stop = 0, start
+        return self.randint(start, stop - 1)
+
+    def choice(self, seq):
+        return seq[self.randint(0, len(seq) - 1)]
+
+    def shuffle(self, x):
+        shuffled = [x[i] for i in self.generator.permutation(len(x)).tolist()]
+        x[:] = array(x.typecode, shuffled) if isinstance(x, array) else shuffled
@@ -0,0 +1,231 @@
+import argparse
+import asyncio
+
+import game_engine
+from game_rng import GameRNG
+
+# Games with wagers that several seats can share
+TABLE_GAMES = ('roulette', 'sic_bo', 'baccarat', 'blackjack', 'pai_gow', 'slots')
+STARTING_BALANCE = 1000
+MAX_TABLES = 100  # Table ids per game run 0 .. MAX_TABLES - 1
+MAX_BUFFERED = 256 * 1024  # Unsent bytes after which a session that stopped reading is dropped
+
+HELP = ("JOIN <game> [table] | BET <type> <value|-> <amount> | BALANCE | TABLES | LEAVE | QUIT"
+        f" -- games: {', '.join(TABLE_GAMES)}")
+
+def parse_value(text: str):
+    # '-' for no value, comma-separated numbers for splits, otherwise a number
+    if text == '-':
+        return None
+    if ',' in text:
+        return tuple(int(v) for v in text.split(','))
+    return int(text)
+
+def format_outcome(outcome) -> str:
+    if isinstance(outcome, tuple):
+        return '-'.join(str(v) for v in outcome)
+    return str(outcome)
+
+class Session:
+    __slots__ = ('writer', 'balance', 'table')
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.balance = STARTING_BALANCE
+        self.table = None
+
+    def send(self, line: str):
+        # Never waits on the client: output is buffered by the transport and
+        # a client that lets the buffer grow too far is disconnected
+        writer = self.writer
+        if writer.is_closing():
+            return
+        if writer.transport.get_write_buffer_size() > MAX_BUFFERED:
+            writer.close()
+            return
+        writer.write(line.encode() + b'\n')
+
+class GameTable:
+    """One engine shared by many seats.
+
+    A timer task opens a betting window, sleeps through it, then plays and
+    settles the round for everyone at once. Playing never yields to the
+    event loop, so every bet lands in the round that is open when it
+    arrives. The task only runs while the table has players; when it ends
+    it calls `on_idle` with the table.
+    """
+
+    def __init__(self, game: str, table_id: int, window: float, rng, on_idle=None, **options):
+        self.game = game
+        self.table_id = table_id
+        self.window = window
+        self.on_idle = on_idle
+        self.engine = game_engine.create(game, rng=rng, **options)
+        self.sessions = set()
+        self.seats = []  # (session, amount) for each bet queued on the engine, in order
+        self.round = 0
+        self.task = None
+
+    def join(self, session: Session):
+        self.sessions.add(session)
+        session.table = self
+        if self.task is None:
+            self.task = asyncio.get_running_loop().create_task(self.run())
+
+    def leave(self, session: Session):
+        # Bets already on the layout stay in play
+        self.sessions.discard(session)
+        session.table = None
+
+    def bet(self, session: Session, bet_type: str, bet_value, amount: float):
+        if not amount > 0:
+            raise ValueError("Bet amount must be positive")
+        if amount > session.balance:
+            raise ValueError("Insufficient balance")
+        self.engine.place_bets([(bet_type, bet_value, amount)])
+        self.seats.append((session, amount))
+        session.balance -= amount
+
+    def broadcast(self, line: str):
+        for session in self.sessions:
+            session.send(line)
+
+    async def run(self):
+        # Bets left behind by players who have gone still get played
+        while self.sessions or self.seats:
+            self.round += 1
+            self.broadcast(f"OPEN {self.game} {self.table_id} {self.round} {self.window:g}")
+            await asyncio.sleep(self.window)
+            self.play()
+        self.task = None
+        if self.on_idle:
+            self.on_idle(self)
+
+    def play(self):
+        engine = self.engine
+        outcome = engine.step()
+        nets = engine.settle()
+        seats, self.seats = self.seats, []
+        self.broadcast(f"RESULT {self.game} {self.table_id} {self.round} {format_outcome(outcome)}")
+        # Stakes were taken when the bets were placed, so credit them back with the net
+        settled = {}
+        for (session, amount), net in zip(seats, nets):
+            session.balance += amount + net
+            settled[session] = settled.get(session, 0) + net
+        for session, net in settled.items():
+            session.send(f"SETTLED {self.round} {net:g} {session.balance:g}")
+
+class GameServer:
+    def __init__(self, window: float = 5.0, seed: int = None):
+        self.window = window
+        self.rng = GameRNG(seed)
+        self.tables = {}
+        self.connected = 0
+        self.house_way = None
+
+    def table(self, game: str, table_id: int) -> GameTable:
+        key = (game, table_id)
+        if key not in self.tables:
+            if game not in TABLE_GAMES:
+                raise ValueError(f"Unknown game: {game}")
+            if not 0 <= table_id < MAX_TABLES:
+                raise ValueError(f"Table must be between 0 and {MAX_TABLES - 1}")
+            options = {}
+            if game == 'pai_gow':
+                # One HouseWay serves every pai gow table; each is large and slow to build
+                if self.house_way is None:
+                    from pai_gow_house_way import HouseWay
+                    self.house_way = HouseWay()
+                options['house_way'] = self.house_way
+            self.tables[key] = GameTable(game, table_id, self.window, self.rng.spawn(1)[0],
+                                         self.drop_table, **options)
+        return self.tables[key]
+
+    def drop_table(self, table: GameTable):
+        # Idle tables are rebuilt on the next JOIN
+        if self.tables.get((table.game, table.table_id)) is table:
+            del self.tables[table.game, table.table_id]
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        session = Session(writer)
+        self.connected += 1
+        session.send(f"HELLO {session.balance:g} {HELP}")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                parts = line.decode(errors='replace').split()
+                if not parts:
+                    continue
+                if parts[0].upper() == 'QUIT':
+                    session.send("OK BYE")
+                    break
+                try:
+                    session.send(self.command(session, parts[0].upper(), parts[1:]))
+                except (ValueError, TypeError, IndexError) as e:
+                    session.send(f"ERR {e or 'Bad arguments'}")
+        except ConnectionError:
+            pass
+        finally:
+            if session.table:
+                session.table.leave(session)
+            self.connected -= 1
+            writer.close()
+
+    def command(self, session: Session, name: str, args: list) -> str:
+        if name == 'JOIN':
+            table = self.table(args[0].lower(), int(args[1]) if len(args) > 1 else 0)
+            if session.table:
+                session.table.leave(session)
+            table.join(session)
+            return f"OK JOINED {table.game} {table.table_id} {session.balance:g}"
+        if name == 'BET':
+            if not session.table:
+                raise ValueError("Join a table first")
+            session.table.bet(session, args[0].lower(), parse_value(args[1]), float(args[2]))
+            return f"OK BET {session.balance:g}"
+        if name == 'BALANCE':
+            return f"OK BALANCE {session.balance:g}"
+        if name == 'TABLES':
+            return "OK TABLES " + ' '.join(f"{t.game}:{t.table_id}:{len(t.sessions)}"
+                                           for t in self.tables.values())
+        if name == 'LEAVE':
+            if session.table:
+                session.table.leave(session)
+            return "OK LEFT"
+        raise ValueError(f"Unknown command: {name}")
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 7777):
+        server = await asyncio.start_server(self.handle, host, port, backlog=4096)
+        async with server:
+            await server.serve_forever()
+
+def raise_file_limit():
+    # Each session holds a socket; lift the soft descriptor limit where the OS allows it
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-table casino server over a line protocol")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--window', type=float, default=5.0, help="Betting window in seconds")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    raise_file_limit()
+    server = GameServer(args.window, args.seed)
+    print(f"Serving on {args.host}:{args.port}, {args.window:g}s betting windows")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+from game_server import raise_file_limit
+
+# A simple bet each bot places every round, by game
+BETS = {
+    'roulette': 'red - 1',
+    'sic_bo': 'small - 1',
+    'baccarat': 'banker - 1',
+    'blackjack': 'hand - 1',
+    'pai_gow': 'hand - 1',
+    'slots': 'spin - 1',
+}
+
+def percentile(values: list, p: float) -> float:
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+class LoadStats:
+    def __init__(self):
+        self.bet_latency = []    # BET sent to OK received
+        self.settle_lag = []     # Betting window end to SETTLED received
+        self.rounds = 0
+        self.errors = 0
+        self.connected = 0
+
+async def bot(host: str, port: int, game: str, table: int, rounds: int, stats: LoadStats):
+    reader, writer = await asyncio.open_connection(host, port)
+    stats.connected += 1
+    try:
+        await reader.readline()  # HELLO
+        writer.write(f"JOIN {game} {table}\n".encode())
+        bet = f"BET {BETS[game]}\n".encode()
+        window_end = None
+        sent = None
+        played = 0
+        while played < rounds:
+            line = await reader.readline()
+            if not line:
+                break
+            kind = line.split(None, 1)[0]
+            if kind == b'OPEN':
+                window_end = time.perf_counter() + float(line.split()[4])
+                sent = time.perf_counter()
+                writer.write(bet)
+            elif kind == b'OK' and line.startswith(b'OK BET') and sent is not None:
+                stats.bet_latency.append(time.perf_counter() - sent)
+                sent = None
+            elif kind == b'SETTLED':
+                if window_end is not None:
+                    stats.settle_lag.append(time.perf_counter() - window_end)
+                played += 1
+                stats.rounds += 1
+            elif kind == b'ERR':
+                stats.errors += 1
+        writer.write(b"QUIT\n")
+    finally:
+        writer.close()
+
+async def run_load(host: str, port: int, sessions: int, games: list, tables: int, rounds: int,
+                   ramp: int) -> LoadStats:
+    stats = LoadStats()
+    tasks = []
+    for i in range(sessions):
+        game = games[i % len(games)]
+        tasks.append(asyncio.create_task(bot(host, port, game, i // len(games) % tables, rounds, stats)))
+        if (i + 1) % ramp == 0:
+            await asyncio.sleep(0.05)  # Don't overflow the listen backlog
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    stats.errors += sum(isinstance(result, Exception) for result in results)
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for game_server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--sessions', type=int, default=2000)
+    parser.add_argument('--games', default=','.join(BETS))
+    parser.add_argument('--tables', type=int, default=10, help="Tables per game")
+    parser.add_argument('--rounds', type=int, default=5, help="Rounds each bot plays")
+    parser.add_argument('--ramp', type=int, default=200, help="Connections opened per 50ms")
+    parser.add_argument('--spawn', action='store_true', help="Start a local server for the run")
+    parser.add_argument('--window', type=float, default=1.0, help="Betting window of a spawned server")
+    args = parser.parse_args()
+
+    raise_file_limit()
+    server = None
+    if args.spawn:
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'game_server.py')
+        server = subprocess.Popen([sys.executable, script, '--host', args.host,
+                                   '--port', str(args.port), '--window', str(args.window)],
+                                  stdout=subprocess.DEVNULL)
+        time.sleep(1.0)
+    try:
+        start = time.perf_counter()
+        stats = asyncio.run(run_load(args.host, args.port, args.sessions, args.games.split(','),
+                                     args.tables, args.rounds, args.ramp))
+        elapsed = time.perf_counter() - start
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    print(f"{stats.connected:,} sessions played {stats.rounds:,} rounds in {elapsed:.1f}s "
+          f"({stats.rounds / elapsed:,.0f} settled bets/s), {stats.errors} errors")
+    for label, values in (("BET round trip", stats.bet_latency), ("Settlement lag", stats.settle_lag)):
+        print(f"{label:15s} p50 {percentile(values, 50) * 1000:7.2f}ms  "
+              f"p90 {percentile(values, 90) * 1000:7.2f}ms  "
+              f"p99 {percentile(values, 99) * 1000:7.2f}ms  "
+              f"max {max(values, default=float('nan')) * 1000:7.2f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,29 @@
 import random
-import time
-import os
 from colorama import init, Fore, Back, Style
 
+from event_log import GLASS_BRIDGE, STEP
+from terminal import clear_screen, pause, screen
+
 init(autoreset=True)
 
 class GlassBridge:
-    def __init__(self, bridge_length=18):
+    def __init__(self, bridge_length=18, rng=None, events=None):
         self.bridge_length = bridge_length
-        self.safe_path = [random.choice([0, 1]) for _ in range(bridge_length)]  # 0 for left, 1 for right
+        self.rng = rng or random
+        self.events = events
+        self.safe_path = [self.rng.choice([0, 1]) for _ in range(bridge_length)]  # 0 for left, 1 for right
         self.current_position = -1
         self.revealed_panels = [[-1, -1] for _ in range(bridge_length)]  # -1: unknown, 0: broken, 1: safe
 
     def display_bridge(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
-        print(Fore.YELLOW + "\n🌉 GLASS BRIDGE GAME 🌉\n" + Style.RESET_ALL)
+        # Every frame follows prompts printed below the bridge, which may have
+        # scrolled the terminal, so redraw from a cleared screen instead of
+        # rewriting rows in place
+        screen.reset()
+        screen.draw(self.render_bridge())
+
+    def render_bridge(self) -> str:
+        lines = [Fore.YELLOW + "\n🌉 GLASS BRIDGE GAME 🌉\n" + Style.RESET_ALL]
 
         # Bridge visualization
         for i in range(self.bridge_length):
@@ -22,11 +31,12 @@ class GlassBridge:
             right_panel = self.get_panel_display(i, 1)
             
             if i == self.current_position:
-                print(f"{i+1:2d}. {left_panel} 🧍 {right_panel}")
+                lines.append(f"{i+1:2d}. {left_panel} 🧍 {right_panel}")
             else:
-                print(f"{i+1:2d}. {left_panel}   {right_panel}")
+                lines.append(f"{i+1:2d}. {left_panel}   {right_panel}")
 
-        print("\nStart 🏃" + "═" * (self.bridge_length * 3) + "🏁 Finish")
+        lines.append("\nStart 🏃" + "═" * (self.bridge_length * 3) + "🏁 Finish")
+        return '\n'.join(lines)
         
     def get_panel_display(self, position, side):
         if position < self.current_position:
@@ -45,24 +55,80 @@ class GlassBridge:
         while True:
             choice = input("\nChoose left (L) or right (R) panel: ").upper()
             if choice in ['L', 'R']:
-                chosen_side = 0 if choice == 'L' else 1
-                is_safe = (self.safe_path[self.current_position + 1] == chosen_side)
-                
-                # Update revealed panels
-                self.revealed_panels[self.current_position + 1] = [
-                    1 if side == self.safe_path[self.current_position + 1] else 0
-                    for side in [0, 1]
-                ]
-                
-                if is_safe:
-                    self.current_position += 1
-                    return True
-                return False
+                return self.step_on(0 if choice == 'L' else 1)
             print("Invalid choice! Please enter L or R.")
 
+    def step_on(self, chosen_side: int) -> bool:
+        is_safe = (self.safe_path[self.current_position + 1] == chosen_side)
+        
+        # Update revealed panels
+        self.revealed_panels[self.current_position + 1] = [
+            1 if side == self.safe_path[self.current_position + 1] else 0
+            for side in [0, 1]
+        ]
+        
+        if self.events:
+            # Row stepped on, times two, plus one if it held
+            self.events.record(STEP, GLASS_BRIDGE, (self.current_position + 1) * 2 + is_safe)
+        
+        if is_safe:
+            self.current_position += 1
+            return True
+        return False
+
+class GlassBridgeEngine:
+    """GameEngine adapter for one player's run: three lives, a fresh bridge
+    after every fall, as in main(). Nothing is wagered, so settle() is empty."""
+
+    name = 'glass_bridge'
+
+    def __init__(self, rng=None, bridge_length=18, lives=3, events=None):
+        self.rng = rng or random
+        self.bridge_length = bridge_length
+        self.lives = lives
+        self.events = events
+        self.reset()
+
+    def reset(self):
+        self.bridge = GlassBridge(self.bridge_length, self.rng, self.events)
+        self.lives_left = self.lives
+        self.best_progress = 0
+        self.crossed = False
+
+    @property
+    def done(self) -> bool:
+        return self.crossed or self.lives_left == 0
+
+    def place_bets(self, bets: list):
+        if bets:
+            raise ValueError("Glass Bridge takes no bets")
+
+    def step(self, action=None) -> bool:
+        # action is 'L'/'R' or 0/1; a random guess when not given
+        if self.done:
+            raise ValueError("The run is over; reset() to start again")
+        side = self.rng.choice([0, 1]) if action is None else {'L': 0, 'R': 1}.get(action, action)
+        safe = self.bridge.step_on(side)
+        self.best_progress = max(self.best_progress, self.bridge.current_position + 1)
+        if not safe:
+            self.lives_left -= 1
+            if self.lives_left:
+                self.bridge = GlassBridge(self.bridge_length, self.rng, self.events)
+        elif self.bridge.current_position == self.bridge_length - 1:
+            self.crossed = True
+        return safe
+
+    def settle(self) -> list:
+        return []
+
+    def snapshot(self) -> dict:
+        return {'game': self.name, 'position': self.bridge.current_position + 1,
+                'best_progress': self.best_progress, 'lives': self.lives_left,
+                'crossed': self.crossed, 'done': self.done}
+
 def main():
     while True:
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         print(Fore.YELLOW + """
 ╔══════════════════════════════════════╗
 ║          GLASS BRIDGE GAME           ║
@@ -90,7 +156,7 @@ Rules:
                     print(Fore.RED + "\n💥 The glass broke! You fell!" + Style.RESET_ALL)
                     best_progress = max(best_progress, game.current_position + 1)
                     game = GlassBridge()
-                    time.sleep(2)
+                    pause(2)
                 continue
             
             # Check for victory
@@ -0,0 +1,143 @@
+import time
+
+import numpy as np
+
+class GlassBridgeOdds:
+    """Exact progress distribution for one player on the glass bridge.
+
+    `accuracy` is the player's chance of picking the safe panel on a row
+    they know nothing about (0.5 for a pure guesser); it stands in for the
+    player's policy, which covers any policy that picks each unknown row
+    independently of the others. With `reset_on_fall`
+    each fall costs a life and the player starts over on a fresh bridge, as
+    in the game's main(). Without it the bridge is kept: the row they fell
+    on is revealed, so they carry on from there with one life fewer.
+    Progress is the furthest number of rows cleared, bridge_length when
+    the player gets across.
+    """
+
+    def __init__(self, bridge_length: int = 18, lives: int = 3, accuracy: float = 0.5,
+                 reset_on_fall: bool = True):
+        self.bridge_length = bridge_length
+        self.lives = lives
+        self.accuracy = accuracy
+        self.reset_on_fall = reset_on_fall
+
+    def attempt_distribution(self) -> np.ndarray:
+        # P(a single attempt from row 0 clears exactly k rows), k = bridge_length means across
+        k = np.arange(self.bridge_length + 1)
+        probs = self.accuracy ** k * (1 - self.accuracy)
+        probs[-1] = self.accuracy ** self.bridge_length
+        return probs
+
+    def progress_distribution(self) -> np.ndarray:
+        # progress[k] is the probability the run ends with k rows as best progress
+        n = self.bridge_length
+        # alive[b, l]: still playing with best progress b and l lives left
+        alive = np.zeros((n + 1, self.lives + 1))
+        alive[0, self.lives] = 1.0
+        progress = np.zeros(n + 1)
+        if self.reset_on_fall:
+            attempt = self.attempt_distribution()
+            for lives in range(self.lives, 0, -1):
+                mass = alive[:, lives].copy()
+                progress[n] += mass.sum() * attempt[n]
+                # Best progress after this fall is the max of the old best and this attempt
+                best = np.maximum.outer(np.arange(n + 1), np.arange(n))
+                moved = np.bincount(best.ravel(), weights=np.outer(mass, attempt[:n]).ravel(),
+                                    minlength=n + 1)
+                if lives > 1:
+                    alive[:, lives - 1] += moved
+                else:
+                    progress += moved
+        else:
+            for row in range(n):
+                for lives in range(1, self.lives + 1):
+                    mass = alive[row, lives]
+                    if not mass:
+                        continue
+                    alive[row + 1, lives] += mass * self.accuracy
+                    if lives > 1:
+                        # The broken row is revealed, so it is cleared on the next life
+                        alive[row + 1, lives - 1] += mass * (1 - self.accuracy)
+                    else:
+                        progress[row] += mass * (1 - self.accuracy)
+            progress[n] += alive[n].sum()
+        return progress
+
+    def survival_probability(self) -> float:
+        return float(self.progress_distribution()[-1])
+
+    def expected_progress(self) -> float:
+        progress = self.progress_distribution()
+        return float(progress @ np.arange(len(progress)))
+
+    def simulate(self, n: int, rng: np.random.Generator = None) -> np.ndarray:
+        """Best progress for n independent players, each bridge a bitmask.
+
+        Bit i of a bridge is the safe side of row i and bit i of a player's
+        choices is the side they pick, so the rows they get right are
+        ~(safe ^ choice) and an attempt clears as many rows as that mask
+        has trailing ones.
+        """
+        rows = self.bridge_length
+        if not 0 < rows < 64:
+            raise ValueError("The batch simulator packs a bridge into 64 bits, so 1-63 rows")
+        rng = rng or np.random.default_rng()
+        full = np.uint64((1 << rows) - 1)
+        attempts = self.lives if self.reset_on_fall else 1
+        best = np.zeros(n, dtype=np.int64)
+        for _ in range(attempts):
+            safe = rng.integers(0, 1 << rows, size=n, dtype=np.uint64)
+            if self.accuracy == 0.5:
+                choice = rng.integers(0, 1 << rows, size=n, dtype=np.uint64)
+            else:
+                choice = safe ^ self._misses(n, rng)
+            wrong = (safe ^ choice) & full
+            if not self.reset_on_fall:
+                # Each fall reveals its row; the run ends on the lives-th wrong pick
+                for _ in range(self.lives - 1):
+                    wrong &= wrong - np.uint64(1)
+            best = np.maximum(best, _trailing_zeros(wrong, rows))
+        return best
+
+    def _misses(self, n: int, rng: np.random.Generator, chunk: int = 1_000_000) -> np.ndarray:
+        # One bit per row, set where the player picks the breaking panel
+        rows = self.bridge_length
+        misses = np.empty(n, dtype=np.uint64)
+        packed = np.zeros((min(chunk, n), 8), dtype=np.uint8)
+        for start in range(0, n, chunk):
+            size = min(chunk, n - start)
+            bits = rng.random((size, rows), dtype=np.float32) < 1 - self.accuracy
+            packed[:size, :(rows + 7) // 8] = np.packbits(bits, axis=1, bitorder='little')
+            misses[start:start + size] = packed[:size].view('<u8').ravel()
+        return misses
+
+def _trailing_zeros(masks: np.ndarray, empty: int) -> np.ndarray:
+    # Index of the lowest set bit, `empty` where no bit is set
+    lowest = masks & (~masks + np.uint64(1))
+    zeros = np.log2(np.where(lowest, lowest, 1).astype(np.float64)).astype(np.int64)
+    return np.where(masks, zeros, empty)
+
+def main():
+    odds = GlassBridgeOdds()
+    print(f"Bridge of {odds.bridge_length} rows, {odds.lives} lives, guessing:")
+    print(f"  Exact survival:   {odds.survival_probability():.6%}")
+    print(f"  Expected best:    {odds.expected_progress():.3f} rows")
+
+    players = 5_000_000
+    start = time.perf_counter()
+    best = odds.simulate(players, np.random.default_rng(0))
+    elapsed = time.perf_counter() - start
+    print(f"  Simulated:        {(best == odds.bridge_length).mean():.6%} survival, "
+          f"{best.mean():.3f} rows ({players / elapsed:,.0f} players/s)")
+
+    print(f"\n{'Rows':>5}{'Lives':>7}{'Fresh bridge':>15}{'Kept bridge':>15}")
+    for rows in (6, 10, 14, 18):
+        for lives in (1, 3, 5):
+            fresh = GlassBridgeOdds(rows, lives).survival_probability()
+            kept = GlassBridgeOdds(rows, lives, reset_on_fall=False).survival_probability()
+            print(f"{rows:>5}{lives:>7}{fresh:>15.4%}{kept:>15.4%}")
+
+if __name__ == "__main__":
+    main()
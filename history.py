@@ -0,0 +1,99 @@
+import mmap
+import os
+import struct
+from array import array
+
+class History:
+    """Fixed-capacity ring buffer of typed columns, one row per spin/roll/hand.
+
+    Appends are O(1) and only the newest `capacity` rows stay in memory.
+    With a `path`, full segments are spilled to an append-only file of
+    fixed-width records that is read back through mmap, so older rows stay
+    queryable and survive restarts.
+    """
+
+    def __init__(self, fields: dict, capacity: int = 4096, path: str = None):
+        # fields maps column name to an array typecode, e.g. {'number': 'B'}
+        self.fields = list(fields)
+        self.record = struct.Struct('<' + ''.join(fields.values()))
+        self.capacity = capacity
+        self.columns = [array(typecode, [0]) * capacity for typecode in fields.values()]
+        self.path = path
+        self.count = 0
+        self.spilled = 0
+        self.loaded = 0
+        self._file = None
+        self._map = None
+        if path:
+            self._file = open(path, 'ab+')
+            self.count = self.spilled = self.loaded = os.path.getsize(path) // self.record.size
+            # Drop a record torn by a crash mid-write so later rows stay aligned
+            self._file.truncate(self.count * self.record.size)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def first(self) -> int:
+        # Oldest row index that can still be read
+        if self._file:
+            return 0
+        return max(0, self.count - self.capacity)
+
+    def append(self, *values):
+        slot = self.count % self.capacity
+        for column, value in zip(self.columns, values):
+            column[slot] = value
+        self.count += 1
+        if self._file and self.count - self.spilled == self.capacity:
+            self.spill()
+
+    def spill(self):
+        # Write rows not yet on disk; they are always still in the ring
+        if not self._file or self.spilled == self.count:
+            return
+        pack = self.record.pack
+        self._file.write(b''.join(pack(*self._ring_row(i)) for i in range(self.spilled, self.count)))
+        self._file.flush()
+        self.spilled = self.count
+
+    def _ring_row(self, index: int) -> tuple:
+        slot = index % self.capacity
+        return tuple(column[slot] for column in self.columns)
+
+    def _mapped(self) -> mmap.mmap:
+        if self._map is None or len(self._map) < self.spilled * self.record.size:
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def row(self, index: int) -> tuple:
+        if index < 0:
+            index += self.count
+        if not self.first <= index < self.count:
+            raise IndexError(f"History row {index} is not available")
+        if index >= max(self.loaded, self.count - self.capacity):
+            return self._ring_row(index)
+        return self.record.unpack_from(self._mapped(), index * self.record.size)
+
+    def rows(self, start: int = None, stop: int = None) -> list:
+        start = self.first if start is None else max(start, self.first)
+        stop = self.count if stop is None else min(stop, self.count)
+        return [self.row(i) for i in range(start, stop)]
+
+    def last(self, n: int) -> list:
+        return self.rows(self.count - n)
+
+    def column(self, name: str, start: int = None, stop: int = None) -> list:
+        position = self.fields.index(name)
+        return [row[position] for row in self.rows(start, stop)]
+
+    def close(self):
+        if self._file:
+            self.spill()
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
+            self._file = None
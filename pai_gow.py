@@ -1,9 +1,16 @@
+import itertools
 import random
-import time
-import os
-from typing import List, Tuple
+from array import array
+from typing import Iterable, List, Tuple
 from colorama import init, Fore, Style
 
+import card_core
+from card_core import SUITS, VALUES
+from event_log import EventLog, PAI_GOW, SETTLE, STEP
+from game_engine import check_bets
+from streaming_stats import StreamingStats
+from terminal import clear_screen
+
 init(autoreset=True)
 
 CARD_TEMPLATE = """
@@ -15,32 +22,66 @@ CARD_TEMPLATE = """
 │      {} │
 └─────────┘"""
 
-class Card:
-    def __init__(self, suit: str, value: str):
-        self.suit = suit
-        self.value = value
-        
-    def get_numeric_value(self) -> int:
-        values = {'A': 14, 'K': 13, 'Q': 12, 'J': 11}
-        return values.get(self.value) or int(self.value)
-        
-    def get_symbol(self) -> str:
-        symbols = {'Hearts': '♥', 'Diamonds': '♦', 'Clubs': '♣', 'Spades': '♠'}
-        return symbols[self.suit]
+CARD_ART = card_core.CardArt(CARD_TEMPLATE)
+
+RANK_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]  # One per value, 2 through A
+
+class Card(card_core.Card):
+    __slots__ = ()
     
-    def get_color(self) -> str:
-        return Fore.RED if self.suit in ['Hearts', 'Diamonds'] else Fore.WHITE
+    def get_numeric_value(self) -> int:
+        return (self.code >> 2) + 2
         
     def display(self) -> str:
-        color = self.get_color()
-        symbol = self.get_symbol()
-        val = self.value.ljust(2)
-        return color + CARD_TEMPLATE.format(val, symbol, val) + Style.RESET_ALL
+        return '\n'.join(CARD_ART.rows(self.code))
+
+# Maps (product of rank primes << 1 | flush) to an integer ordered the same
+# way as the PaiGowHand.get_hand_rank tuples, for both 5-card and 2-card hands
+_RANK_TABLE = {}
+
+def _rank_key(rank: Tuple[int, List[int]]) -> int:
+    category, values = rank
+    key = category
+    for i in range(5):
+        # Missing positions pad with 0 so a 2-card list sorts below a longer one it prefixes
+        key = (key << 4) | (values[i] if i < len(values) else 0)
+    return key
+
+def _build_rank_table() -> dict:
+    for size in (2, 5):
+        for values in itertools.combinations_with_replacement(range(len(VALUES)), size):
+            if any(values.count(v) > 4 for v in values):
+                continue
+            product = 1
+            for v in values:
+                product *= RANK_PRIMES[v]
+            # Equal values are adjacent, so cycling suits never repeats a card or makes a flush
+            cards = [Card(SUITS[i % 4], VALUES[v]) for i, v in enumerate(values)]
+            _RANK_TABLE[product << 1] = _rank_key(PaiGowHand(cards).get_hand_rank())
+            if len(set(values)) == size:
+                cards = [Card(SUITS[0], VALUES[v]) for v in values]
+                _RANK_TABLE[product << 1 | 1] = _rank_key(PaiGowHand(cards).get_hand_rank())
+    return _RANK_TABLE
+
+def hand_rank(codes: Iterable[int]) -> int:
+    table = _RANK_TABLE or _build_rank_table()
+    product = 1
+    suits = 0
+    for code in codes:
+        product *= RANK_PRIMES[code >> 2]
+        suits |= 1 << (code & 3)
+    return table[product << 1 | (suits & (suits - 1) == 0)]
+
+CARDS = [Card.from_code(code) for code in range(52)]
 
 class PaiGowHand:
     def __init__(self, cards: List[Card]):
         self.cards = sorted(cards, key=lambda x: x.get_numeric_value(), reverse=True)
         
+    @property
+    def rank(self) -> int:
+        return hand_rank(card.code for card in self.cards)
+        
     def get_hand_rank(self) -> Tuple[int, List[int]]:
         values = [card.get_numeric_value() for card in self.cards]
         suits = [card.suit for card in self.cards]
@@ -93,35 +134,35 @@ class PaiGowHand:
         return (0, values)
         
     def display(self) -> str:
-        cards_display = [card.display().split('\n') for card in self.cards]
-        result = []
-        for i in range(len(cards_display[0])):
-            line = ''
-            for card_lines in cards_display:
-                if i < len(card_lines):
-                    line += card_lines[i] + ' '
-            result.append(line)
-        return '\n'.join(result)
+        return CARD_ART.join([CARD_ART.rows(card.code) for card in self.cards])
+
+# Settlement outcome codes in the event log
+RESULTS = ['win', 'push', 'lose']
 
 class PaiGow:
-    def __init__(self):
+    def __init__(self, rng: random.Random = None, house_way=None, live_stats: StreamingStats = None,
+                 events: EventLog = None):
+        self.rng = rng or random
+        self.events = events
+        self.house_way = house_way
         self.deck = self.create_deck()
         self.stats = {'games': 0, 'wins': 0, 'pushes': 0}
+        self.live_stats = live_stats or StreamingStats()
         
-    def create_deck(self) -> List[Card]:
-        suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-        values = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-        deck = [Card(suit, value) for suit in suits for value in values]
-        random.shuffle(deck)
+    def create_deck(self) -> array:
+        deck = card_core.new_deck()
+        self.rng.shuffle(deck)
         return deck
         
     def deal_hands(self) -> Tuple[List[Card], List[Card]]:
-        player_cards = [self.deck.pop() for _ in range(7)]
-        dealer_cards = [self.deck.pop() for _ in range(7)]
+        player_cards = [CARDS[self.deck.pop()] for _ in range(7)]
+        dealer_cards = [CARDS[self.deck.pop()] for _ in range(7)]
         return player_cards, dealer_cards
         
     def set_hands(self, cards: List[Card], is_dealer: bool = False) -> Tuple[PaiGowHand, PaiGowHand]:
         if is_dealer:
+            if self.house_way is not None:
+                return self.house_way.set_hand(cards)
             # Simple dealer strategy: put highest cards in back hand
             sorted_cards = sorted(cards, key=lambda x: x.get_numeric_value(), reverse=True)
             back_hand = PaiGowHand(sorted_cards[:5])
@@ -151,7 +192,7 @@ class PaiGow:
                 front_hand = PaiGowHand(front_cards)
                 
                 # Check if back hand is stronger than front hand
-                if back_hand.get_hand_rank() <= front_hand.get_hand_rank():
+                if back_hand.rank <= front_hand.rank:
                     print("Back hand must be stronger than front hand!")
                     continue
                     
@@ -162,8 +203,8 @@ class PaiGow:
                 
     def compare_hands(self, player_back: PaiGowHand, player_front: PaiGowHand,
                      dealer_back: PaiGowHand, dealer_front: PaiGowHand) -> str:
-        back_result = player_back.get_hand_rank() > dealer_back.get_hand_rank()
-        front_result = player_front.get_hand_rank() > dealer_front.get_hand_rank()
+        back_result = player_back.rank > dealer_back.rank
+        front_result = player_front.rank > dealer_front.rank
         
         if back_result and front_result:
             return 'win'
@@ -172,15 +213,75 @@ class PaiGow:
         else:
             return 'push'
 
+class PaiGowEngine:
+    """GameEngine adapter: the player's hand is set the house way and every
+    bet rides on it against the dealer."""
+    
+    name = 'pai_gow'
+    
+    def __init__(self, rng: random.Random = None, events: EventLog = None, house_way=None):
+        # Engines can share one HouseWay; its strength tables and split cache are large
+        if house_way is None:
+            from pai_gow_house_way import HouseWay
+            house_way = HouseWay()
+        self.game = PaiGow(rng, house_way, events=events)
+        self.reset()
+    
+    def reset(self):
+        self.bets = []
+        self.hands = None
+        self.result = None
+    
+    def place_bets(self, bets: list):
+        self.bets.extend(check_bets(bets, ('hand',)))
+    
+    def step(self, action=None) -> str:
+        game = self.game
+        if len(game.deck) < 14:
+            game.deck = game.create_deck()
+        player_cards, dealer_cards = game.deal_hands()
+        player_back, player_front = game.set_hands(player_cards, is_dealer=True)
+        dealer_back, dealer_front = game.set_hands(dealer_cards, is_dealer=True)
+        self.hands = (player_back, player_front, dealer_back, dealer_front)
+        self.result = game.compare_hands(*self.hands)
+        game.stats['games'] += 1
+        if self.result == 'win':
+            game.stats['wins'] += 1
+        elif self.result == 'push':
+            game.stats['pushes'] += 1
+        game.live_stats.record_outcome(self.result)
+        if game.events:
+            # One per round, however many bets ride on it
+            game.events.record(STEP, PAI_GOW, RESULTS.index(self.result))
+        return self.result
+    
+    def settle(self) -> list:
+        game = self.game
+        nets = []
+        for _, _, amount in self.bets:
+            net = {'win': amount, 'push': 0, 'lose': -amount}[self.result]
+            game.live_stats.record_payout(net)
+            if game.events:
+                game.events.record(SETTLE, PAI_GOW, RESULTS.index(self.result), amount, net)
+            nets.append(net)
+        self.bets = []
+        return nets
+    
+    def snapshot(self) -> dict:
+        hands = [[str(card) for card in hand.cards] for hand in self.hands] if self.hands else None
+        return {'game': self.name, 'result': self.result, 'hands': hands, 'bets': list(self.bets),
+                'stats': dict(self.game.stats)}
+
 def main():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
     print(Fore.YELLOW + """
     ╔════════════════════════════════╗
     ║         PAI GOW POKER          ║
     ╚════════════════════════════════╝
     """ + Style.RESET_ALL)
     
-    game = PaiGow()
+    from pai_gow_house_way import HouseWay
+    game = PaiGow(house_way=HouseWay())
     balance = 100
     initial_balance = balance
     
@@ -228,6 +329,12 @@ def main():
             
             # Determine winner
             result = game.compare_hands(player_back, player_front, dealer_back, dealer_front)
+            game.live_stats.record_outcome(result)
+            net = {'win': bet, 'push': 0, 'lose': -bet}[result]
+            game.live_stats.record_payout(net)
+            if game.events:
+                game.events.record(STEP, PAI_GOW, RESULTS.index(result))
+                game.events.record(SETTLE, PAI_GOW, RESULTS.index(result), bet, net)
             
             if result == 'win':
                 game.stats['wins'] += 1
@@ -0,0 +1,107 @@
+import functools
+import itertools
+import math
+from typing import List, Tuple
+
+import numpy as np
+
+from pai_gow import RANK_PRIMES, VALUES, Card, PaiGowHand, hand_rank
+
+# The 21 ways to pick 5 of 7 cards for the back hand; the other 2 go in front
+BACKS = list(itertools.combinations(range(7), 5))
+FRONTS = [tuple(i for i in range(7) if i not in back) for back in BACKS]
+
+def _rank_strengths(size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Weight every (value multiset, flush) class by how many real hands it
+    # covers, then turn the rank distribution into "share of hands this
+    # rank beats or ties" -- the dealer wins ties.
+    weights = {}
+    ranks = {}
+    for values in itertools.combinations_with_replacement(range(len(VALUES)), size):
+        counts = [values.count(v) for v in set(values)]
+        if max(counts) > 4:
+            continue
+        key = math.prod(RANK_PRIMES[v] for v in values) << 1
+        total = math.prod(math.comb(4, c) for c in counts)
+        flushes = 4 if len(counts) == size else 0
+        for flush, weight in ((0, total - flushes), (1, flushes)):
+            if weight:
+                codes = [v * 4 + (0 if flush else i % 4) for i, v in enumerate(values)]
+                ranks[key | flush] = hand_rank(codes)
+                weights[key | flush] = weight
+
+    by_rank = {}
+    for key, rank in ranks.items():
+        by_rank[rank] = by_rank.get(rank, 0) + weights[key]
+    below = 0
+    strength_of = {}
+    hands = sum(by_rank.values())
+    for rank in sorted(by_rank):
+        below += by_rank[rank]
+        strength_of[rank] = below / hands
+
+    keys = np.array(sorted(ranks), dtype=np.int64)
+    return (keys,
+            np.array([ranks[k] for k in keys], dtype=np.int64),
+            np.array([strength_of[ranks[k]] for k in keys]))
+
+class HouseWay:
+    """Sets a 7-card hand by scoring all 21 back/front splits.
+
+    A split's value is estimated as P(back wins) + P(front wins) - 1, which
+    is its EV against a random opponent if the two halves are independent.
+    Illegal splits (front ranking at or above back) are never chosen.
+    """
+
+    def __init__(self, cache_size: int = 1 << 16):
+        self.back_keys, self.back_ranks, self.back_strengths = _rank_strengths(5)
+        self.front_keys, self.front_ranks, self.front_strengths = _rank_strengths(2)
+        self.back_strength = dict(zip(self.back_ranks.tolist(), self.back_strengths.tolist()))
+        self.front_strength = dict(zip(self.front_ranks.tolist(), self.front_strengths.tolist()))
+        self.best_split = functools.lru_cache(maxsize=cache_size)(self._best_split)
+
+    def _best_split(self, codes: Tuple[int, ...]) -> int:
+        best, best_score = 0, -2.0
+        for i, (back, front) in enumerate(zip(BACKS, FRONTS)):
+            back_rank = hand_rank(codes[j] for j in back)
+            front_rank = hand_rank(codes[j] for j in front)
+            if back_rank <= front_rank:
+                continue
+            score = self.back_strength[back_rank] + self.front_strength[front_rank]
+            if score > best_score:
+                best, best_score = i, score
+        return best
+
+    def set_hand(self, cards: List[Card]) -> Tuple[PaiGowHand, PaiGowHand]:
+        cards = sorted(cards, key=lambda card: card.code)
+        split = self.best_split(tuple(card.code for card in cards))
+        return (PaiGowHand([cards[i] for i in BACKS[split]]),
+                PaiGowHand([cards[i] for i in FRONTS[split]]))
+
+    def _lookup(self, codes: np.ndarray, keys: np.ndarray, values: np.ndarray) -> np.ndarray:
+        primes = np.array(RANK_PRIMES, dtype=np.int64)[codes >> 2]
+        suits = codes & 3
+        flush = (suits == suits[..., :1]).all(axis=-1)
+        return values[np.searchsorted(keys, (primes.prod(axis=-1) << 1) | flush)]
+
+    def best_splits(self, hands: np.ndarray) -> np.ndarray:
+        # Vectorized form of best_split for an (N, 7) array of card codes.
+        # Returns split indices into BACKS/FRONTS for each row sorted by code.
+        hands = np.sort(np.asarray(hands, dtype=np.int64), axis=1)
+        backs = hands[:, BACKS]
+        fronts = hands[:, FRONTS]
+        legal = (self._lookup(backs, self.back_keys, self.back_ranks) >
+                 self._lookup(fronts, self.front_keys, self.front_ranks))
+        score = (self._lookup(backs, self.back_keys, self.back_strengths) +
+                 self._lookup(fronts, self.front_keys, self.front_strengths))
+        return np.where(legal, score, -2.0).argmax(axis=1)
+
+    def split_ranks(self, hands: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # hand_rank of the back and front hands the house way sets, for an (N, 7) array of card codes
+        hands = np.sort(np.asarray(hands, dtype=np.int64), axis=1)
+        split = self.best_splits(hands)
+        rows = np.arange(len(hands))[:, None]
+        backs = hands[rows, np.array(BACKS)[split]]
+        fronts = hands[rows, np.array(FRONTS)[split]]
+        return (self._lookup(backs, self.back_keys, self.back_ranks),
+                self._lookup(fronts, self.front_keys, self.front_ranks))
@@ -1,8 +1,12 @@
 import random
-import time
-import os
 from colorama import init, Fore, Back, Style
 
+from event_log import EventLog, ROULETTE, SETTLE, SPIN
+from game_engine import check_bets
+from history import History
+from streaming_stats import StreamingStats
+from terminal import clear_screen, pause
+
 init(autoreset=True)
 
 NUMBERS = {
@@ -20,6 +24,10 @@ NUMBERS = {
 
 BETS = {
     'straight': {'desc': 'Single number (0-36)', 'payout': 35},
+    'split': {'desc': 'Two adjacent numbers', 'payout': 17},
+    'street': {'desc': 'Row of three numbers', 'payout': 11},
+    'corner': {'desc': 'Four numbers meeting at a corner', 'payout': 8},
+    'line': {'desc': 'Two adjacent rows (six numbers)', 'payout': 5},
     'red': {'desc': 'Red numbers', 'payout': 1},
     'black': {'desc': 'Black numbers', 'payout': 1},
     'even': {'desc': 'Even numbers', 'payout': 1},
@@ -31,52 +39,191 @@ BETS = {
     '3rd12': {'desc': 'Third dozen (25-36)', 'payout': 2}
 }
 
+# Color name and terminal color of each pocket, indexed by number
+COLORS = [NUMBERS[n][1] for n in range(37)]
+COLOR_CODES = [Fore.GREEN if c == 'green' else Fore.RED if c == 'red' else Fore.WHITE for c in COLORS]
+
+def mask(numbers) -> int:
+    # 37-bit coverage mask: bit n is set when the bet wins on pocket n
+    result = 0
+    for n in numbers:
+        result |= 1 << n
+    return result
+
+BET_MASKS = {
+    'red': mask(n for n in range(37) if COLORS[n] == 'red'),
+    'black': mask(n for n in range(37) if COLORS[n] == 'black'),
+    'even': mask(range(2, 37, 2)),
+    'odd': mask(range(1, 37, 2)),
+    '1-18': mask(range(1, 19)),
+    '19-36': mask(range(19, 37)),
+    '1st12': mask(range(1, 13)),
+    '2nd12': mask(range(13, 25)),
+    '3rd12': mask(range(25, 37)),
+}
+
+VALUE_PROMPTS = {
+    'straight': "Enter number (0-36): ",
+    'split': "Enter two adjacent numbers (e.g. 8 11): ",
+    'street': "Enter the first number of the row (1, 4, ... 34): ",
+    'corner': "Enter the lowest number of the corner (e.g. 1 for 1-2-4-5): ",
+    'line': "Enter the first number of the first row (1, 4, ... 31): ",
+}
+
+def bet_numbers(bet_type: str, bet_value: any) -> tuple:
+    # Pockets covered by a bet placed on the layout; rows are n, n+1, n+2 for n = 1, 4, ... 34
+    try:
+        if bet_type == 'split':
+            a, b = sorted(int(v) for v in bet_value)
+        else:
+            n = int(bet_value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {bet_type} bet: {bet_value}") from None
+    if bet_type == 'split':
+        if (a == 0 and b in (1, 2, 3)) or (a >= 1 and b <= 36 and (b - a == 3 or (b - a == 1 and a % 3 != 0))):
+            return a, b
+    elif bet_type == 'straight' and 0 <= n <= 36:
+        return (n,)
+    elif bet_type == 'street' and 1 <= n <= 34 and n % 3 == 1:
+        return n, n + 1, n + 2
+    elif bet_type == 'corner' and 1 <= n <= 32 and n % 3 != 0:
+        return n, n + 1, n + 3, n + 4
+    elif bet_type == 'line' and 1 <= n <= 31 and n % 3 == 1:
+        return tuple(range(n, n + 6))
+    raise ValueError(f"Invalid {bet_type} bet: {bet_value}")
+
+def layout_bets() -> list:
+    # Every distinct (bet_type, bet_value) the layout accepts
+    bets = [(bet_type, None) for bet_type in BET_MASKS]
+    bets += [('straight', n) for n in range(37)]
+    bets += [('split', (0, n)) for n in (1, 2, 3)]
+    bets += [('split', (n, n + 1)) for n in range(1, 36) if n % 3]
+    bets += [('split', (n, n + 3)) for n in range(1, 34)]
+    bets += [('street', n) for n in range(1, 35, 3)]
+    bets += [('corner', n) for n in range(1, 33) if n % 3]
+    bets += [('line', n) for n in range(1, 32, 3)]
+    return bets
+
+def coverage(bet_type: str, bet_value: any = None) -> int:
+    if bet_type in VALUE_PROMPTS:
+        return mask(bet_numbers(bet_type, bet_value))
+    return BET_MASKS.get(bet_type, 0)
+
 class RouletteWheel:
-    def __init__(self):
+    def __init__(self, history: History = None, live_stats: StreamingStats = None,
+                 rng: random.Random = None, events: EventLog = None):
         self.numbers = NUMBERS
-        self.history = []
+        self.rng = rng or random
+        self.events = events
+        self.history = history if history is not None else History({'number': 'B'})
         self.stats = {'spins': 0, 'red': 0, 'black': 0, 'green': 0}
+        self.live_stats = live_stats or StreamingStats()
     
     def spin(self) -> int:
-        result = random.randint(0, 36)
+        result = self.rng.randint(0, 36)
         self.history.append(result)
         self.stats['spins'] += 1
-        self.stats[self.numbers[result][1]] += 1
+        self.stats[COLORS[result]] += 1
+        self.live_stats.record_outcome(result)
+        if self.events:
+            self.events.record(SPIN, ROULETTE, result)
         return result
     
     def check_win(self, bet_type: str, bet_value: any, result: int) -> bool:
-        number, color = self.numbers[result]
-        
-        if bet_type == 'straight':
-            return result == int(bet_value)
-        elif bet_type in ['red', 'black']:
-            return color == bet_type
-        elif bet_type == 'even':
-            return result != 0 and result % 2 == 0
-        elif bet_type == 'odd':
-            return result != 0 and result % 2 == 1
-        elif bet_type == '1-18':
-            return 1 <= result <= 18
-        elif bet_type == '19-36':
-            return 19 <= result <= 36
-        elif bet_type == '1st12':
-            return 1 <= result <= 12
-        elif bet_type == '2nd12':
-            return 13 <= result <= 24
-        elif bet_type == '3rd12':
-            return 25 <= result <= 36
-            
-        return False
+        return bool(coverage(bet_type, bet_value) >> result & 1)
 
     def display_wheel(self, result: int = None):
         print("\n" + "═" * 50)
         print(Fore.YELLOW + "🎯 Roulette Wheel" + Style.RESET_ALL)
         if result is not None:
-            number, color = self.numbers[result]
-            color_code = Fore.GREEN if color == 'green' else Fore.RED if color == 'red' else Fore.WHITE
-            print(f"\nBall landed on: {color_code}{number} {color}{Style.RESET_ALL}")
+            print(f"\nBall landed on: {COLOR_CODES[result]}{result} {COLORS[result]}{Style.RESET_ALL}")
         print("═" * 50)
 
+class Table:
+    """Many seats betting on one wheel.
+    
+    Bets are pooled by coverage mask and payout as they are placed, so a
+    spin costs one bit test per distinct bet plus one credit per winning
+    seat, however many chips are on the layout.
+    """
+    
+    def __init__(self, wheel: RouletteWheel = None):
+        self.wheel = wheel or RouletteWheel()
+        self.pools = {}  # (mask, payout) -> {seat: total staked}
+    
+    def place_bets(self, seat: any, bets: list):
+        # bets is a list of (bet_type, bet_value, amount); all are checked before any is placed
+        checked = []
+        for bet_type, bet_value, amount in bets:
+            if bet_type not in BETS:
+                raise ValueError(f"Unknown bet type: {bet_type}")
+            if amount <= 0:
+                raise ValueError(f"Bet amount must be positive: {amount}")
+            checked.append(((coverage(bet_type, bet_value), BETS[bet_type]['payout']), amount))
+        for key, amount in checked:
+            stakes = self.pools.setdefault(key, {})
+            stakes[seat] = stakes.get(seat, 0) + amount
+    
+    def total_staked(self) -> dict:
+        totals = {}
+        for stakes in self.pools.values():
+            for seat, amount in stakes.items():
+                totals[seat] = totals.get(seat, 0) + amount
+        return totals
+    
+    def settle(self, result: int) -> dict:
+        # Amount returned to each seat (stakes included) on winning bets; clears the layout
+        returns = {}
+        for (bet_mask, payout), stakes in self.pools.items():
+            if bet_mask >> result & 1:
+                for seat, amount in stakes.items():
+                    returns[seat] = returns.get(seat, 0) + amount * (payout + 1)
+        self.pools = {}
+        return returns
+    
+    def spin(self) -> tuple:
+        result = self.wheel.spin()
+        return result, self.settle(result)
+
+class RouletteEngine:
+    """GameEngine adapter: every bet on the layout settles against one spin."""
+    
+    name = 'roulette'
+    
+    def __init__(self, rng: random.Random = None, events: EventLog = None):
+        self.wheel = RouletteWheel(rng=rng, events=events)
+        self.reset()
+    
+    def reset(self):
+        self.bets = []
+        self.result = None
+    
+    def place_bets(self, bets: list):
+        bets = check_bets(bets, BETS)
+        for bet_type, bet_value, _ in bets:
+            coverage(bet_type, bet_value)  # Rejects layout bets with a bad value
+        self.bets.extend(bets)
+    
+    def step(self, action=None) -> int:
+        self.result = self.wheel.spin()
+        return self.result
+    
+    def settle(self) -> list:
+        wheel = self.wheel
+        nets = []
+        for bet_type, bet_value, amount in self.bets:
+            net = amount * BETS[bet_type]['payout'] if wheel.check_win(bet_type, bet_value, self.result) else -amount
+            wheel.live_stats.record_payout(net)
+            if wheel.events:
+                wheel.events.record(SETTLE, ROULETTE, self.result, amount, net)
+            nets.append(net)
+        self.bets = []
+        return nets
+    
+    def snapshot(self) -> dict:
+        return {'game': self.name, 'result': self.result, 'bets': list(self.bets),
+                'stats': dict(self.wheel.stats)}
+
 def display_menu():
     print("\nBetting Options:")
     for bet_type, info in BETS.items():
@@ -98,19 +245,21 @@ def get_bet_input(balance: int) -> tuple:
                 continue
                 
             bet_value = None
-            if bet_type == 'straight':
-                bet_value = input("Enter number (0-36): ")
-                if not bet_value.isdigit() or not 0 <= int(bet_value) <= 36:
+            if bet_type in VALUE_PROMPTS:
+                entered = input(VALUE_PROMPTS[bet_type]).split()
+                try:
+                    bet_value = tuple(int(v) for v in entered) if bet_type == 'split' else int(entered[0])
+                    bet_numbers(bet_type, bet_value)
+                except (ValueError, IndexError):
                     print("Invalid number!")
                     continue
-                bet_value = int(bet_value)
                 
             return bet_type, bet_value, bet_amount
         except ValueError:
             print("Invalid input!")
 
 def main():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
     print(Fore.YELLOW + """
     ╔════════════════════════════════╗
     ║           ROULETTE             ║
@@ -128,10 +277,8 @@ def main():
             
             if wheel.history:
                 print("\nLast 5 spins:", ' '.join([
-                    (Fore.GREEN if wheel.numbers[n][1] == 'green' else
-                     Fore.RED if wheel.numbers[n][1] == 'red' else
-                     Fore.WHITE) + wheel.numbers[n][0] + Style.RESET_ALL
-                    for n in wheel.history[-5:]
+                    COLOR_CODES[n] + str(n) + Style.RESET_ALL
+                    for (n,) in wheel.history.last(5)
                 ]))
             
             display_menu()
@@ -142,7 +289,7 @@ def main():
                 
             balance -= bet_amount
             print(f"\n{Fore.CYAN}Spinning the wheel...{Style.RESET_ALL}")
-            time.sleep(1)
+            pause(1)
             
             result = wheel.spin()
             wheel.display_wheel(result)
@@ -150,8 +297,14 @@ def main():
             if wheel.check_win(bet_type, bet_value, result):
                 winnings = bet_amount * (BETS[bet_type]['payout'] + 1)
                 balance += winnings
+                wheel.live_stats.record_payout(winnings - bet_amount)
+                if wheel.events:
+                    wheel.events.record(SETTLE, ROULETTE, result, bet_amount, winnings - bet_amount)
                 print(f"{Fore.GREEN}You won ${winnings - bet_amount}!{Style.RESET_ALL}")
             else:
+                wheel.live_stats.record_payout(-bet_amount)
+                if wheel.events:
+                    wheel.events.record(SETTLE, ROULETTE, result, bet_amount, -bet_amount)
                 print(f"{Fore.RED}You lost ${bet_amount}!{Style.RESET_ALL}")
                 
     except KeyboardInterrupt:
@@ -0,0 +1,66 @@
+import time
+
+import numpy as np
+
+from roulette import BETS, coverage, layout_bets
+
+class Portfolio:
+    """A set of roulette bets, each reduced to a coverage mask and a return."""
+
+    def __init__(self):
+        self.bets = []
+        self.masks = []
+        self.returns = []  # Amount paid back (stake included) when the bet wins
+        self._payoff = None
+
+    def add(self, bet_type: str, bet_value: any, amount: float):
+        if bet_type not in BETS:
+            raise ValueError(f"Unknown bet type: {bet_type}")
+        self.bets.append((bet_type, bet_value, amount))
+        self.masks.append(coverage(bet_type, bet_value))
+        self.returns.append(amount * (BETS[bet_type]['payout'] + 1))
+        self._payoff = None
+
+    def settle(self, result: int) -> list:
+        # Return for each bet against one spin, by bit test
+        return [paid if m >> result & 1 else 0 for m, paid in zip(self.masks, self.returns)]
+
+    def coverage_matrix(self) -> np.ndarray:
+        # covered[n, i] is True when bet i wins on pocket n
+        bits = np.arange(37, dtype=np.uint64)
+        masks = np.array(self.masks, dtype=np.uint64)
+        return ((masks[None, :] >> bits[:, None]) & np.uint64(1)).astype(bool)
+
+    def payoff(self) -> np.ndarray:
+        # Total return of the whole portfolio for each of the 37 pockets
+        if self._payoff is None:
+            self._payoff = self.coverage_matrix() @ np.array(self.returns, dtype=np.float64)
+        return self._payoff
+
+    def settle_spins(self, spins: np.ndarray, per_bet: bool = False) -> np.ndarray:
+        # Total return per spin, or an (N, bets) array of returns with per_bet
+        spins = np.asarray(spins, dtype=np.intp)
+        if per_bet:
+            return self.coverage_matrix()[spins] * np.array(self.returns, dtype=np.float64)
+        return self.payoff()[spins]
+
+def main():
+    rng = np.random.default_rng(0)
+    portfolio = Portfolio()
+    layout = layout_bets()
+    for _ in range(60):
+        bet_type, value = layout[rng.integers(len(layout))]
+        portfolio.add(bet_type, value, int(rng.integers(1, 20)))
+
+    staked = sum(amount for _, _, amount in portfolio.bets)
+    spins = rng.integers(0, 37, size=5_000_000)
+    start = time.perf_counter()
+    returns = portfolio.settle_spins(spins)
+    elapsed = time.perf_counter() - start
+    print(f"Settled {len(portfolio.bets)} bets over {len(spins):,} spins in {elapsed:.2f}s "
+          f"({len(spins) / elapsed:,.0f} spins/s)")
+    print(f"Exact return per spin: {portfolio.payoff().mean() / staked:.4%} of stake, "
+          f"simulated: {returns.mean() / staked:.4%}")
+
+if __name__ == "__main__":
+    main()
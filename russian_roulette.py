@@ -1,29 +1,86 @@
 import random
-import time
-import os
 
-def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+from event_log import RUSSIAN_ROULETTE, STEP
+import terminal
+from terminal import clear_screen, screen
 
 def print_dramatic(text, delay=0.03):
+    if terminal.turbo:
+        print(text)
+        return
+    # Typewriter effect paced per character, without drifting on slow terminals
+    screen.reset()
     for char in text:
         print(char, end='', flush=True)
-        time.sleep(delay)
+        screen.tick(delay)
     print()
 
-def set_bullet_count():
+def set_bullet_count(chambers=6):
     while True:
         try:
             print("\n" + "="*40)
-            bullets = int(input("How many bullets do you want to load? (1-5): "))
-            if 1 <= bullets <= 5:
+            bullets = int(input(f"How many bullets do you want to load? (1-{chambers - 1}): "))
+            if 1 <= bullets < chambers:
                 return bullets
             else:
-                print("⚠ Please enter a number between 1 and 5!")
+                print(f"⚠ Please enter a number between 1 and {chambers - 1}!")
         except ValueError:
             print("⚠ Please enter a valid number!")
 
-def russian_roulette():
+class RussianRouletteEngine:
+    """GameEngine adapter: one loaded cylinder per reset, one pull per step.
+    Nothing is wagered, so settle() is empty."""
+
+    name = 'russian_roulette'
+
+    def __init__(self, rng=None, bullets=1, chambers=6, respin=False, events=None):
+        if not 1 <= bullets < chambers:
+            raise ValueError(f"Bullets must be between 1 and {chambers - 1}")
+        self.rng = rng or random
+        self.bullets = bullets
+        self.chambers = chambers
+        self.respin = respin
+        self.events = events
+        self.reset()
+
+    def reset(self):
+        self.cylinder = [False] * (self.chambers - self.bullets) + [True] * self.bullets
+        self.rng.shuffle(self.cylinder)
+        self.round_number = 0
+        self.fired = False
+
+    @property
+    def done(self) -> bool:
+        return self.fired or self.round_number == self.chambers
+
+    def place_bets(self, bets: list):
+        if bets:
+            raise ValueError("Russian roulette takes no bets")
+
+    def step(self, action=None) -> bool:
+        # True when the chamber was loaded
+        if self.done:
+            raise ValueError("The game is over; reset() to load again")
+        if self.respin:
+            self.fired = self.cylinder[self.rng.randrange(self.chambers)]
+        else:
+            self.fired = self.cylinder[self.round_number]
+        self.round_number += 1
+        if self.events:
+            self.events.record(STEP, RUSSIAN_ROULETTE, self.round_number * 2 + self.fired)
+        return self.fired
+
+    def settle(self) -> list:
+        return []
+
+    def snapshot(self) -> dict:
+        return {'game': self.name, 'round': self.round_number, 'bullets': self.bullets,
+                'chambers': self.chambers, 'alive': not self.fired, 'done': self.done}
+
+def russian_roulette(rng=None, events=None, chambers=6, respin=False):
+    # With respin the cylinder is spun again before every pull; either way
+    # surviving `chambers` pulls wins
+    rng = rng or random
     clear_screen()
     print("""
     ╔══════════════════════════════════╗
@@ -32,21 +89,28 @@ def russian_roulette():
     """)
     print_dramatic("Warning: This is just a simulation game!\n")
 
-    bullet_count = set_bullet_count()
-    chambers = [False] * (6 - bullet_count) + [True] * bullet_count
-    random.shuffle(chambers)
+    bullet_count = set_bullet_count(chambers)
+    cylinder = [False] * (chambers - bullet_count) + [True] * bullet_count
+    rng.shuffle(cylinder)
 
     print_dramatic("\nLoading the revolver...")
-    print(f"[{bullet_count}] bullets loaded | [{'🔴' * bullet_count + '⚪' * (6-bullet_count)}]")
+    print(f"[{bullet_count}] bullets loaded | [{'🔴' * bullet_count + '⚪' * (chambers - bullet_count)}]")
     
     print_dramatic("\nSpinning the cylinder...")
     print("*CLICK* *WHIRR* *CLICK*")
 
     round_number = 1
-    while chambers:
+    while round_number <= chambers:
         print(f"\n{'='*10} Round {round_number} {'='*10}")
         input("Press Enter to pull the trigger...")
-        pulled_chamber = chambers.pop(0)
+        if respin:
+            print("*WHIRR*")
+            pulled_chamber = cylinder[rng.randrange(chambers)]
+        else:
+            # The hammer just advances one chamber per round
+            pulled_chamber = cylinder[round_number - 1]
+        if events:
+            events.record(STEP, RUSSIAN_ROULETTE, round_number * 2 + pulled_chamber)
 
         if pulled_chamber:
             print("\n*BANG!*")
@@ -66,10 +130,10 @@ def russian_roulette():
         else:
             print("\n*click*")
             print("😌 You survived this round!")
-            if chambers:
-                print(f"Chambers remaining: {len(chambers)}")
+            if round_number < chambers:
+                print(f"Chambers remaining: {chambers - round_number}")
 
-        if not chambers:
+        if round_number == chambers:
             print("\n🎉 Congratulations! You've survived! 🎉")
             break
             
@@ -1,8 +1,13 @@
 import random
-import time
-import os
 from colorama import init, Fore, Style
 
+from event_log import EventLog, ROLL, SETTLE, SIC_BO
+from game_engine import check_bets
+from history import History
+from streaming_stats import StreamingStats
+import terminal
+from terminal import clear_screen, screen
+
 init(autoreset=True)
 
 DICE_FRAMES = {
@@ -49,6 +54,9 @@ DICE_FRAMES = {
  └─────────┘"""]
 }
 
+# Rows of each die face, split once instead of on every frame
+DICE_ROWS = {face: frames[0].split('\n') for face, frames in DICE_FRAMES.items()}
+
 BETS = {
     'small': {'desc': 'Sum 4-10 (excl. triples)', 'payout': 1},
     'big': {'desc': 'Sum 11-17 (excl. triples)', 'payout': 1},
@@ -65,26 +73,41 @@ BETS = {
     }}
 }
 
+def roll_code(dice: tuple) -> int:
+    # Same index as sic_bo_odds.roll_index, 0..215
+    return (dice[0] - 1) * 36 + (dice[1] - 1) * 6 + dice[2] - 1
+
 class SicBo:
-    def __init__(self):
-        self.history = []
+    def __init__(self, history: History = None, live_stats: StreamingStats = None,
+                 rng: random.Random = None, events: EventLog = None):
+        self.rng = rng or random
+        self.events = events
+        self.history = history if history is not None else History({'die1': 'B', 'die2': 'B', 'die3': 'B'})
         self.stats = {'rolls': 0, 'wins': 0, 'biggest_win': 0}
+        self.live_stats = live_stats or StreamingStats()
     
     def roll_dice(self) -> tuple:
-        return tuple(random.randint(1, 6) for _ in range(3))
+        result = tuple(self.rng.randint(1, 6) for _ in range(3))
+        if self.events:
+            self.events.record(ROLL, SIC_BO, roll_code(result))
+        return result
     
     def animate_roll(self):
+        if terminal.turbo:
+            return
         frames = 10
+        screen.reset()
         for _ in range(frames):
-            os.system('cls' if os.name == 'nt' else 'clear')
+            # Animation frames don't draw from self.rng, so audited streams are unaffected
             temp_dice = [random.randint(1, 6) for _ in range(3)]
-            self.display_dice(temp_dice)
-            time.sleep(0.1)
+            screen.draw(self.render_dice(temp_dice))
+            screen.tick(0.1)
+    
+    def render_dice(self, dice: list) -> str:
+        return '\n'.join('  '.join(row) for row in zip(*(DICE_ROWS[d] for d in dice)))
     
     def display_dice(self, dice: list):
-        dice_art = [DICE_FRAMES[d][0].split('\n') for d in dice]
-        for i in range(len(dice_art[0])):
-            print('  '.join(d[i] for d in dice_art))
+        print(self.render_dice(dice))
     
     def check_win(self, bet_type: str, bet_value: any, result: tuple) -> float:
         total = sum(result)
@@ -109,7 +132,7 @@ class SicBo:
             return 8 if 2 in value_counts else 0
             
         elif bet_type == 'total':
-            return BETS[bet_type]['payout'].get(total, 0)
+            return BETS[bet_type]['payout'].get(total, 0) if total == int(bet_value) else 0
             
         elif bet_type == 'single':
             count = result.count(int(bet_value))
@@ -117,6 +140,57 @@ class SicBo:
             
         return 0
 
+class SicBoEngine:
+    """GameEngine adapter: every bet settles against one roll."""
+    
+    name = 'sic_bo'
+    
+    def __init__(self, rng: random.Random = None, events: EventLog = None):
+        self.game = SicBo(rng=rng, events=events)
+        self.reset()
+    
+    def reset(self):
+        self.bets = []
+        self.result = None
+    
+    def place_bets(self, bets: list):
+        bets = check_bets(bets, BETS)
+        for bet_type, bet_value, _ in bets:
+            if bet_type == 'total' and bet_value not in BETS['total']['payout']:
+                raise ValueError(f"Invalid total bet: {bet_value}")
+            if bet_type == 'single' and bet_value not in range(1, 7):
+                raise ValueError(f"Invalid single bet: {bet_value}")
+        self.bets.extend(bets)
+    
+    def step(self, action=None) -> tuple:
+        game = self.game
+        self.result = game.roll_dice()
+        game.history.append(*self.result)
+        game.stats['rolls'] += 1
+        game.live_stats.record_outcome(sum(self.result))
+        return self.result
+    
+    def settle(self) -> list:
+        game = self.game
+        nets = []
+        for bet_type, bet_value, amount in self.bets:
+            # Multipliers are profit per unit staked, as in sic_bo_odds
+            multiplier = game.check_win(bet_type, bet_value, self.result)
+            net = amount * multiplier if multiplier > 0 else -amount
+            if net > 0:
+                game.stats['wins'] += 1
+                game.stats['biggest_win'] = max(game.stats['biggest_win'], net)
+            game.live_stats.record_payout(net)
+            if game.events:
+                game.events.record(SETTLE, SIC_BO, roll_code(self.result), amount, net)
+            nets.append(net)
+        self.bets = []
+        return nets
+    
+    def snapshot(self) -> dict:
+        return {'game': self.name, 'result': self.result, 'bets': list(self.bets),
+                'stats': dict(self.game.stats)}
+
 def display_menu():
     print("\nBetting Options:")
     for bet_type, info in BETS.items():
@@ -161,7 +235,7 @@ def get_bet_input(balance: int) -> tuple:
             print("Invalid input!")
 
 def main():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
     print(Fore.YELLOW + """
     ╔════════════════════════════════╗
     ║           SIC BO               ║
@@ -180,7 +254,7 @@ def main():
             if game.history:
                 print("\nLast 5 rolls:", ' '.join(
                     f"{sum(roll)}({','.join(map(str, roll))})"
-                    for roll in game.history[-5:]
+                    for roll in game.history.last(5)
                 ))
             
             display_menu()
@@ -194,22 +268,30 @@ def main():
             game.animate_roll()
             
             result = game.roll_dice()
-            game.history.append(result)
+            game.history.append(*result)
             game.stats['rolls'] += 1
+            game.live_stats.record_outcome(sum(result))
             
             print(f"\n{Fore.CYAN}Final Result:{Style.RESET_ALL}")
             game.display_dice(result)
             print(f"Sum: {sum(result)}")
             
+            # Multipliers are profit per unit, so a win also returns the stake
             multiplier = game.check_win(bet_type, bet_value, result)
-            winnings = bet_amount * multiplier
+            profit = bet_amount * multiplier
             
             if multiplier > 0:
-                balance += winnings
+                balance += bet_amount + profit
                 game.stats['wins'] += 1
-                game.stats['biggest_win'] = max(game.stats['biggest_win'], winnings - bet_amount)
-                print(f"\n{Fore.GREEN}You won ${winnings - bet_amount}!{Style.RESET_ALL}")
+                game.stats['biggest_win'] = max(game.stats['biggest_win'], profit)
+                game.live_stats.record_payout(profit)
+                if game.events:
+                    game.events.record(SETTLE, SIC_BO, roll_code(result), bet_amount, profit)
+                print(f"\n{Fore.GREEN}You won ${profit}!{Style.RESET_ALL}")
             else:
+                game.live_stats.record_payout(-bet_amount)
+                if game.events:
+                    game.events.record(SETTLE, SIC_BO, roll_code(result), bet_amount, -bet_amount)
                 print(f"\n{Fore.RED}You lost ${bet_amount}!{Style.RESET_ALL}")
                 
     except KeyboardInterrupt:
@@ -0,0 +1,87 @@
+import itertools
+
+import numpy as np
+
+from sic_bo import BETS, SicBo
+
+# Every possible roll, in the order used to index the payout table
+OUTCOMES = np.array(list(itertools.product(range(1, 7), repeat=3)), dtype=np.int8)
+SUMS = OUTCOMES.sum(axis=1)
+FACE_COUNTS = np.stack([(OUTCOMES == face).sum(axis=1) for face in range(1, 7)], axis=1)
+
+def roll_index(rolls: np.ndarray) -> np.ndarray:
+    rolls = np.asarray(rolls, dtype=np.intp) - 1
+    return rolls[..., 0] * 36 + rolls[..., 1] * 6 + rolls[..., 2]
+
+class SicBoOdds:
+    def __init__(self, bets: dict = BETS):
+        self.bets = bets
+        self.keys = []
+        rows = []
+        game = SicBo()
+        rolls = [tuple(int(d) for d in roll) for roll in OUTCOMES]
+        for bet_type in bets:
+            if bet_type == 'total':
+                for total in range(4, 18):
+                    self.keys.append((bet_type, total))
+                    rows.append(self.total_row(total))
+            elif bet_type == 'single':
+                for face in range(1, 7):
+                    self.keys.append((bet_type, face))
+                    rows.append(self.single_row(face))
+            else:
+                self.keys.append((bet_type, None))
+                rows.append([game.check_win(bet_type, None, roll) for roll in rolls])
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        # Multiplier paid for each (bet, roll) pair, 0 when the bet loses
+        self.payouts = np.array(rows, dtype=np.float64)
+        # Profit per unit staked, -1 when the bet loses
+        self.net = np.where(self.payouts > 0, self.payouts, -1.0)
+
+    def total_row(self, total: int) -> np.ndarray:
+        return np.where(SUMS == total, self.bets['total']['payout'].get(total, 0), 0)
+
+    def single_row(self, face: int) -> np.ndarray:
+        table = np.array([self.bets['single']['payout'].get(count, 0) for count in range(4)])
+        return table[FACE_COUNTS[:, face - 1]]
+
+    def expected_value(self, bet_type: str, bet_value: int = None) -> float:
+        return float(self.net[self.index[(bet_type, bet_value)]].mean())
+
+    def win_probability(self, bet_type: str, bet_value: int = None) -> float:
+        return float((self.payouts[self.index[(bet_type, bet_value)]] > 0).mean())
+
+    def house_edges(self) -> dict:
+        return dict(zip(self.keys, -self.net.mean(axis=1)))
+
+    def score(self, rolls: np.ndarray) -> np.ndarray:
+        # Profit for every bet against every roll, shape (len(keys), len(rolls))
+        return self.net[:, roll_index(rolls)]
+
+    def simulate(self, n: int, rng: np.random.Generator = None) -> np.ndarray:
+        rng = rng or np.random.default_rng()
+        rolls = rng.integers(1, 7, size=(n, 3))
+        return self.score(rolls).mean(axis=1)
+
+def price_totals(payouts: dict) -> dict:
+    # EV per unit for each exact-total bet under a candidate paytable
+    counts = np.bincount(SUMS, minlength=19)
+    return {total: (counts[total] * payout - (216 - counts[total])) / 216
+            for total, payout in payouts.items()}
+
+def price_singles(payouts: dict) -> float:
+    # EV per unit for a single-number bet under a candidate paytable
+    counts = np.bincount(FACE_COUNTS[:, 0], minlength=4)
+    won = sum(counts[k] * payouts.get(k, 0) for k in range(1, 4))
+    return (won - counts[0]) / 216
+
+def main():
+    odds = SicBoOdds()
+    print(f"{'Bet':<12}{'P(win)':>10}{'EV':>10}")
+    for bet_type, bet_value in odds.keys:
+        label = bet_type if bet_value is None else f"{bet_type} {bet_value}"
+        print(f"{label:<12}{odds.win_probability(bet_type, bet_value):>10.4%}"
+              f"{odds.expected_value(bet_type, bet_value):>10.4%}")
+
+if __name__ == "__main__":
+    main()
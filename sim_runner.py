@@ -0,0 +1,150 @@
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from game_rng import GameRNG
+from sim_stats import SimulationResult
+
+SHARD_ROUNDS = 100_000  # Fixed shard size so results don't depend on worker count
+
+def simulate_blackjack(rounds: int, rng: random.Random, stand_on: int = 17, decks: int = 6,
+                       basic_strategy: bool = False) -> SimulationResult:
+    from blackjack_sim import BlackjackSimulator, StandOnPolicy
+    from blackjack_strategy import StrategyPolicy, full_shoe, solve
+    policy = StrategyPolicy(solve(full_shoe(decks))) if basic_strategy else StandOnPolicy(stand_on)
+    return BlackjackSimulator(policy, decks, rng).run(rounds)
+
+def simulate_baccarat(rounds: int, rng: random.Random, bet: str = 'banker') -> SimulationResult:
+    from baccarat import Baccarat
+    game = Baccarat(rng)
+    result = SimulationResult()
+    for _ in range(rounds):
+        winner, winnings = game.play_headless(bet)
+        result.record(winner, winnings)
+    return result
+
+def simulate_sic_bo(rounds: int, rng: random.Random, bet: str = 'small', value: int = None) -> SimulationResult:
+    from sic_bo import SicBo
+    game = SicBo()
+    randint = rng.randint
+    result = SimulationResult()
+    for _ in range(rounds):
+        roll = (randint(1, 6), randint(1, 6), randint(1, 6))
+        multiplier = game.check_win(bet, value, roll)
+        if multiplier > 0:
+            result.record('win', multiplier)
+        else:
+            result.record('lose', -1)
+    return result
+
+def simulate_roulette(rounds: int, rng: random.Random, bet: str = 'red', value: int = None) -> SimulationResult:
+    from roulette import BETS, RouletteWheel
+    wheel = RouletteWheel()
+    payout = BETS[bet]['payout']
+    randint = rng.randint
+    result = SimulationResult()
+    for _ in range(rounds):
+        if wheel.check_win(bet, value, randint(0, 36)):
+            result.record('win', payout)
+        else:
+            result.record('lose', -1)
+    return result
+
+def simulate_slots(rounds: int, rng: random.Random) -> SimulationResult:
+    from slot_machine import SlotMachine
+    machine = SlotMachine()
+    symbols = machine.symbols
+    choice = rng.choice
+    result = SimulationResult()
+    for _ in range(rounds):
+        win = machine.calculate_win((choice(symbols), choice(symbols), choice(symbols)), 1)
+        result.record('win' if win else 'lose', win - 1)
+    return result
+
+def simulate_pai_gow(rounds: int, rng: random.Random, block: int = 30_000) -> SimulationResult:
+    import numpy as np
+    from pai_gow_house_way import HouseWay
+    house_way = HouseWay()
+    generator = np.random.default_rng(rng.getrandbits(64))
+    result = SimulationResult()
+    for start in range(0, rounds, block):
+        size = min(block, rounds - start)
+        # The game deals three rounds from each shuffled deck, then takes a fresh one
+        decks = np.argsort(generator.random(((size + 2) // 3, 52)), axis=1)
+        hands = decks[:, :42].reshape(-1, 14)[:size]
+        # Headless players set their hands the same way the dealer does
+        player_back, player_front = house_way.split_ranks(hands[:, :7])
+        dealer_back, dealer_front = house_way.split_ranks(hands[:, 7:])
+        won = (player_back > dealer_back).astype(np.int8) + (player_front > dealer_front)
+        wins, pushes = int(np.count_nonzero(won == 2)), int(np.count_nonzero(won == 1))
+        result.record_many('win', wins, 1)
+        result.record_many('push', pushes, 0)
+        result.record_many('lose', size - wins - pushes, -1)
+    return result
+
+GAMES = {
+    'blackjack': simulate_blackjack,
+    'baccarat': simulate_baccarat,
+    'sic_bo': simulate_sic_bo,
+    'roulette': simulate_roulette,
+    'slots': simulate_slots,
+    'pai_gow': simulate_pai_gow,
+}
+
+def _run_shard(task: tuple) -> SimulationResult:
+    game, rounds, sequence, options = task
+    return GAMES[game](rounds, GameRNG(sequence), **options)
+
+def run(game: str, rounds: int, workers: int = None, seed: int = None,
+        shard_rounds: int = SHARD_ROUNDS, **options) -> SimulationResult:
+    if game not in GAMES:
+        raise ValueError(f"Unknown game: {game}")
+    shards = [shard_rounds] * (rounds // shard_rounds)
+    if rounds % shard_rounds:
+        shards.append(rounds % shard_rounds)
+    # Each shard gets its own child of one SeedSequence, so streams are
+    # independent and the same seed always reproduces the same run
+    streams = GameRNG(seed).sequence.spawn(len(shards))
+    tasks = [(game, shard, stream, options) for shard, stream in zip(shards, streams)]
+
+    result = SimulationResult()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for task in tasks:
+            result.merge(_run_shard(task))
+        return result
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for shard_result in pool.map(_run_shard, tasks):
+            result.merge(shard_result)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless table game simulations across all cores")
+    parser.add_argument('game', choices=sorted(GAMES))
+    parser.add_argument('--rounds', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--bet', default=None, help="Bet type for baccarat, sic_bo and roulette")
+    parser.add_argument('--value', type=int, default=None, help="Bet value for straight/total/single bets")
+    args = parser.parse_args()
+
+    options = {}
+    if args.bet is not None:
+        options['bet'] = args.bet
+    if args.value is not None:
+        options['value'] = args.value
+
+    start = time.perf_counter()
+    result = run(args.game, args.rounds, args.workers, args.seed, **options)
+    elapsed = time.perf_counter() - start
+
+    low, high = result.confidence_interval()
+    print(f"{args.game}: {result.rounds:,} rounds in {elapsed:.1f}s ({result.rounds / elapsed:,.0f}/s)")
+    for outcome, rate in result.summary()['rates'].items():
+        print(f"  {outcome:<10} {rate:.4%}")
+    print(f"  House edge: {result.house_edge:.4%} (95% CI {low:.4%} .. {high:.4%})")
+
+if __name__ == "__main__":
+    main()
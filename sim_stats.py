@@ -0,0 +1,56 @@
+import math
+
+class SimulationResult:
+    def __init__(self):
+        self.rounds = 0
+        self.counts = {}
+        self.net = 0.0       # Sum of per-round profit in units of the bet
+        self.net_sq = 0.0    # Sum of squared profit, for the variance
+
+    def record(self, outcome: str, net: float):
+        self.rounds += 1
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
+        self.net += net
+        self.net_sq += net * net
+
+    def record_many(self, outcome: str, count: int, net: float):
+        # count rounds that all ended in outcome with the same net
+        self.rounds += count
+        self.counts[outcome] = self.counts.get(outcome, 0) + count
+        self.net += count * net
+        self.net_sq += count * net * net
+
+    def merge(self, other: 'SimulationResult') -> 'SimulationResult':
+        self.rounds += other.rounds
+        for outcome, count in other.counts.items():
+            self.counts[outcome] = self.counts.get(outcome, 0) + count
+        self.net += other.net
+        self.net_sq += other.net_sq
+        return self
+
+    def rate(self, outcome: str) -> float:
+        return self.counts.get(outcome, 0) / self.rounds if self.rounds else 0.0
+
+    @property
+    def house_edge(self) -> float:
+        return -self.net / self.rounds if self.rounds else 0.0
+
+    @property
+    def std_error(self) -> float:
+        if self.rounds < 2:
+            return 0.0
+        mean = self.net / self.rounds
+        variance = (self.net_sq - self.rounds * mean * mean) / (self.rounds - 1)
+        return math.sqrt(max(variance, 0.0) / self.rounds)
+
+    def confidence_interval(self, z: float = 1.96) -> tuple:
+        margin = z * self.std_error
+        return self.house_edge - margin, self.house_edge + margin
+
+    def summary(self) -> dict:
+        return {
+            'rounds': self.rounds,
+            'rates': {outcome: self.rate(outcome) for outcome in sorted(self.counts)},
+            'house_edge': self.house_edge,
+            'house_edge_ci': self.confidence_interval(),
+        }
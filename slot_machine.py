@@ -1,8 +1,12 @@
 import random
-import time
-import os
 from colorama import init, Fore, Style
 
+from event_log import EventLog, SETTLE, SLOTS, SPIN
+from game_engine import check_bets
+from streaming_stats import StreamingStats
+import terminal
+from terminal import clear_screen, screen
+
 init(autoreset=True)
 
 SYMBOLS = {
@@ -23,16 +27,72 @@ PAYLINES = {
     ('CHERRY', '*', '*'): 2,
 }
 
+class ReelStrip:
+    """Virtual reel with a weight (number of stops) per symbol, sampled in O(1)
+    with Walker's alias method."""
+    
+    def __init__(self, weights: dict = None):
+        weights = weights or {symbol: 1 for symbol in SYMBOLS}
+        self.weights = [weights.get(symbol, 0) for symbol in SYMBOLS]
+        n = len(self.weights)
+        total = sum(self.weights)
+        scaled = [w * n / total for w in self.weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1 - scaled[s]
+            (small if scaled[l] < 1 else large).append(l)
+        self._arrays = None
+    
+    def sample(self, rng: random.Random = random) -> int:
+        u = rng.random() * len(self.prob)
+        column = int(u)
+        return column if u - column < self.prob[column] else self.alias[column]
+    
+    def sample_many(self, n: int, rng=None):
+        import numpy as np
+        if self._arrays is None:
+            self._arrays = np.array(self.prob), np.array(self.alias)
+        prob, alias = self._arrays
+        rng = rng or np.random.default_rng()
+        u = rng.random(n) * len(prob)
+        column = u.astype(np.intp)
+        return np.where(u - column < prob[column], column, alias[column])
+
 class SlotMachine:
-    def __init__(self):
+    def __init__(self, paylines: dict = None, reels: list = None, rng: random.Random = None,
+                 live_stats: StreamingStats = None, events: EventLog = None):
         self.symbols = list(SYMBOLS.keys())
+        self.events = events
+        self.paylines = paylines or PAYLINES
+        self.reels = reels or [ReelStrip() for _ in range(3)]
+        self.rng = rng or random
         self.stats = {'spins': 0, 'wins': 0, 'biggest_win': 0}
+        self.live_stats = live_stats or StreamingStats()
         
     def spin(self) -> tuple:
-        return tuple(random.choice(self.symbols) for _ in range(3))
+        codes = [reel.sample(self.rng) for reel in self.reels]
+        if self.events:
+            self.events.record(SPIN, SLOTS, self.spin_code(codes))
+        return tuple(self.symbols[code] for code in codes)
+    
+    def spin_code(self, codes: list) -> int:
+        # Symbol codes packed base len(symbols), first reel most significant
+        n = len(self.symbols)
+        return (codes[0] * n + codes[1]) * n + codes[2]
+    
+    def spin_many(self, n: int, rng=None):
+        # Symbol codes (indexes into self.symbols) for n spins, shape (n, 3)
+        import numpy as np
+        return np.stack([reel.sample_many(n, rng) for reel in self.reels], axis=1)
     
     def calculate_win(self, result: tuple, bet: int) -> int:
-        for pattern, multiplier in PAYLINES.items():
+        for pattern, multiplier in self.paylines.items():
             matches = 0
             for i, symbol in enumerate(pattern):
                 if symbol == '*' or symbol == result[i]:
@@ -44,13 +104,14 @@ class SlotMachine:
         return 0
     
     def display_spin_animation(self):
+        if terminal.turbo:
+            return
         frames = ['| • ◦ ◦ |', '| ◦ • ◦ |', '| ◦ ◦ • |']
+        screen.reset()
         for _ in range(2):  # Two complete cycles
             for frame in frames:
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print(f"\n\n\n{Fore.CYAN}{frame}", end='')
-                time.sleep(0.1)
-        print("\r", end='')
+                screen.draw(f"\n\n\n{Fore.CYAN}{frame}{Style.RESET_ALL}")
+                screen.tick(0.1)
     
     def display_result(self, result: tuple):
         symbols_display = [SYMBOLS[s][0] for s in result]
@@ -60,8 +121,50 @@ class SlotMachine:
 ║ {symbols_display[0]} ║ {symbols_display[1]} ║ {symbols_display[2]} ║
 ╚═══╩═══╩═══╝""")
 
+class SlotEngine:
+    """GameEngine adapter: each step is one spin, each bet a stake on it."""
+    
+    name = 'slots'
+    
+    def __init__(self, rng: random.Random = None, reels: list = None, events: EventLog = None):
+        self.machine = SlotMachine(reels=reels, rng=rng, events=events)
+        self.reset()
+    
+    def reset(self):
+        self.bets = []
+        self.result = None
+    
+    def place_bets(self, bets: list):
+        self.bets.extend(check_bets(bets, ('spin',)))
+    
+    def step(self, action=None) -> tuple:
+        self.result = self.machine.spin()
+        self.machine.stats['spins'] += 1
+        self.machine.live_stats.record_outcome(self.result)
+        return self.result
+    
+    def settle(self) -> list:
+        machine = self.machine
+        code = machine.spin_code([machine.symbols.index(s) for s in self.result])
+        nets = []
+        for _, _, amount in self.bets:
+            win_amount = machine.calculate_win(self.result, amount)
+            if win_amount > 0:
+                machine.stats['wins'] += 1
+                machine.stats['biggest_win'] = max(machine.stats['biggest_win'], win_amount)
+            machine.live_stats.record_payout(win_amount - amount)
+            if machine.events:
+                machine.events.record(SETTLE, SLOTS, code, amount, win_amount - amount)
+            nets.append(win_amount - amount)
+        self.bets = []
+        return nets
+    
+    def snapshot(self) -> dict:
+        return {'game': self.name, 'result': self.result, 'bets': list(self.bets),
+                'stats': dict(self.machine.stats)}
+
 def main():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
     print(Fore.YELLOW + """
     ╔════════════════════════════════╗
     ║         SLOT MACHINE           ║
@@ -98,7 +201,7 @@ def main():
             machine.stats['spins'] += 1
             
             input("Press Enter to pull the lever...")
-            os.system('cls' if os.name == 'nt' else 'clear')
+            clear_screen()
             print(f"\n{Fore.YELLOW}Balance: ${balance}")
             print(f"Session: {'▲' if balance > initial_balance else '▼'} ${abs(balance - initial_balance)}\n")
             
@@ -109,6 +212,11 @@ def main():
             
             win_amount = machine.calculate_win(result, bet)
             balance += win_amount
+            machine.live_stats.record_outcome(result)
+            machine.live_stats.record_payout(win_amount - bet)
+            if machine.events:
+                machine.events.record(SETTLE, SLOTS, machine.spin_code([machine.symbols.index(s) for s in result]),
+                                      bet, win_amount - bet)
             
             if win_amount > 0:
                 machine.stats['wins'] += 1
@@ -0,0 +1,68 @@
+import itertools
+import time
+
+import numpy as np
+
+from slot_machine import PAYLINES, ReelStrip, SlotMachine
+
+class SlotOdds:
+    def __init__(self, paylines: dict = PAYLINES):
+        machine = SlotMachine(paylines)
+        self.symbols = machine.symbols
+        n = len(self.symbols)
+        # payout[a, b, c] is the multiplier for reels showing symbol codes a, b, c
+        self.payout = np.zeros((n, n, n))
+        for codes in itertools.product(range(n), repeat=3):
+            result = tuple(self.symbols[code] for code in codes)
+            self.payout[codes] = machine.calculate_win(result, 1)
+
+    def reel_weights(self, reels: list = None) -> list:
+        # Per-reel symbol probabilities from ReelStrips or raw weight lists;
+        # uniform reels by default
+        if reels is None:
+            return [np.full(len(self.symbols), 1 / len(self.symbols))] * 3
+        weights = [getattr(reel, 'weights', reel) for reel in reels]
+        return [np.asarray(w, dtype=np.float64) / np.sum(w) for w in weights]
+
+    def distribution(self, reels: list = None) -> np.ndarray:
+        first, second, third = self.reel_weights(reels)
+        return np.einsum('i,j,k->ijk', first, second, third)
+
+    def rtp(self, reels: list = None) -> float:
+        return float((self.distribution(reels) * self.payout).sum())
+
+    def hit_frequency(self, reels: list = None) -> float:
+        return float(self.distribution(reels)[self.payout > 0].sum())
+
+    def variance(self, reels: list = None) -> float:
+        probs = self.distribution(reels)
+        mean = (probs * self.payout).sum()
+        return float((probs * self.payout ** 2).sum() - mean ** 2)
+
+    def score(self, spins: np.ndarray) -> np.ndarray:
+        # Multiplier for each row of an (N, 3) array of symbol codes
+        return self.payout[spins[:, 0], spins[:, 1], spins[:, 2]]
+
+    def simulate(self, n: int, rng: np.random.Generator = None, reels: list = None) -> np.ndarray:
+        rng = rng or np.random.default_rng()
+        if reels is not None:
+            # Raw weight lists become strips, so both forms reel_weights accepts work here
+            strips = [reel if isinstance(reel, ReelStrip) else ReelStrip(dict(zip(self.symbols, reel)))
+                      for reel in reels]
+            return self.score(SlotMachine(reels=strips).spin_many(n, rng))
+        return self.score(rng.integers(0, len(self.symbols), size=(n, 3)))
+
+def main():
+    odds = SlotOdds()
+    print(f"Exact RTP:      {odds.rtp():.4%}")
+    print(f"Hit frequency:  {odds.hit_frequency():.4%}")
+    print(f"Std deviation:  {odds.variance() ** 0.5:.3f}x bet")
+
+    spins = 10_000_000
+    start = time.perf_counter()
+    payouts = odds.simulate(spins, np.random.default_rng(0))
+    elapsed = time.perf_counter() - start
+    print(f"Simulated RTP:  {payouts.mean():.4%} over {spins:,} spins ({spins / elapsed:,.0f} spins/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import bisect
+import math
+
+# Payout histogram bin edges; bin i counts payouts below EDGES[i], the last bin the rest
+DEFAULT_EDGES = [-100, -10, -1, 0, 1, 10, 100, 1000]
+
+class RunningMoments:
+    """Welford mean/variance with min and max, mergeable with Chan's formula."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x: float):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def merge(self, other: 'RunningMoments') -> 'RunningMoments':
+        if other.n:
+            n = self.n + other.n
+            delta = other.mean - self.mean
+            self.mean += delta * other.n / n
+            self.m2 += other.m2 + delta * delta * self.n * other.n / n
+            self.n = n
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+class StreamingStats:
+    """O(1)-per-event aggregates for a game: outcome frequencies and streaks,
+    plus running moments and a histogram of payouts."""
+
+    def __init__(self, edges: list = None):
+        self.edges = edges or DEFAULT_EDGES
+        self.payouts = RunningMoments()
+        self.histogram = [0] * (len(self.edges) + 1)
+        self.frequencies = {}
+        self.longest_streaks = {}
+        self.streak_outcome = None
+        self.streak_length = 0
+
+    def record_outcome(self, outcome):
+        self.frequencies[outcome] = self.frequencies.get(outcome, 0) + 1
+        if outcome == self.streak_outcome:
+            self.streak_length += 1
+        else:
+            self.streak_outcome = outcome
+            self.streak_length = 1
+        if self.streak_length > self.longest_streaks.get(outcome, 0):
+            self.longest_streaks[outcome] = self.streak_length
+
+    def record_payout(self, amount: float):
+        # Net result of one settled bet, negative for a loss
+        self.payouts.add(amount)
+        self.histogram[bisect.bisect_right(self.edges, amount)] += 1
+
+    def hot(self, n: int = 5) -> list:
+        return sorted(self.frequencies.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def cold(self, n: int = 5, outcomes: list = None) -> list:
+        # Pass every possible outcome to count ones that never came up as cold
+        counts = {outcome: self.frequencies.get(outcome, 0) for outcome in (outcomes or self.frequencies)}
+        return sorted(counts.items(), key=lambda item: item[1])[:n]
+
+    def merge(self, other: 'StreamingStats') -> 'StreamingStats':
+        # Streaks can't be stitched across processes: longest streaks take the
+        # max and the current streak is whichever side was merged last
+        if other.edges != self.edges:
+            raise ValueError("Cannot merge stats with different histogram edges")
+        self.payouts.merge(other.payouts)
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+        for outcome, count in other.frequencies.items():
+            self.frequencies[outcome] = self.frequencies.get(outcome, 0) + count
+        for outcome, length in other.longest_streaks.items():
+            self.longest_streaks[outcome] = max(self.longest_streaks.get(outcome, 0), length)
+        if other.streak_length:
+            self.streak_outcome = other.streak_outcome
+            self.streak_length = other.streak_length
+        return self
+
+    def snapshot(self) -> dict:
+        return {
+            'events': sum(self.frequencies.values()),
+            'settled': self.payouts.n,
+            'mean_payout': self.payouts.mean,
+            'payout_std': math.sqrt(self.payouts.variance),
+            'min_payout': self.payouts.min if self.payouts.n else None,
+            'max_payout': self.payouts.max if self.payouts.n else None,
+            'histogram': list(zip(self.edges + [math.inf], self.histogram)),
+            'frequencies': dict(self.frequencies),
+            'current_streak': (self.streak_outcome, self.streak_length),
+            'longest_streaks': dict(self.longest_streaks),
+        }
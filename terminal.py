@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+
+CLEAR = '\x1b[2J\x1b[H'
+
+# Skip every animation delay, for automated runs; also enabled by CASINO_TURBO=1
+turbo = os.environ.get('CASINO_TURBO', '') not in ('', '0')
+
+def set_turbo(enabled: bool = True):
+    global turbo
+    turbo = enabled
+
+def pause(seconds: float):
+    if not turbo:
+        time.sleep(seconds)
+
+def clear_screen():
+    # ANSI clear instead of spawning cls/clear; colorama translates it on Windows
+    sys.stdout.write(CLEAR)
+    sys.stdout.flush()
+    screen.reset()
+
+class Renderer:
+    """Draws full-screen frames in place.
+
+    Only lines that changed since the previous frame are rewritten, anything
+    printed below the last frame is erased, and each frame goes out in a
+    single write. tick() paces animations against a fixed frame interval,
+    so time spent rendering comes out of the delay instead of adding to it.
+    """
+
+    def __init__(self):
+        self.lines = None
+        self.deadline = None
+
+    def reset(self):
+        # Next frame redraws everything, e.g. after the screen was cleared
+        self.lines = None
+        self.deadline = None
+
+    def draw(self, frame: str):
+        lines = frame.split('\n')
+        if self.lines is None:
+            out = [CLEAR, '\n'.join(lines)]
+        else:
+            out = [f'\x1b[{row};1H{line}\x1b[K'
+                   for row, line in enumerate(lines, 1)
+                   if row > len(self.lines) or self.lines[row - 1] != line]
+        out.append(f'\x1b[{len(lines) + 1};1H\x1b[J')
+        self.lines = lines
+        sys.stdout.write(''.join(out))
+        sys.stdout.flush()
+
+    def tick(self, interval: float):
+        if turbo:
+            return
+        now = time.monotonic()
+        if self.deadline is None or now - self.deadline > interval:
+            self.deadline = now
+        self.deadline += interval
+        time.sleep(max(0.0, self.deadline - time.monotonic()))
+
+screen = Renderer()
@@ -0,0 +1,26 @@
+import itertools
+import random
+
+from pai_gow import CARDS, PaiGowHand, hand_rank
+
+def assert_same_order(hands: list):
+    # Sorted by the rank tuples, the table ranks must rise exactly where the tuples do
+    ranked = sorted((PaiGowHand(cards).get_hand_rank(), hand_rank(card.code for card in cards))
+                    for cards in hands)
+    for (tuple_a, rank_a), (tuple_b, rank_b) in zip(ranked, ranked[1:]):
+        if tuple_a == tuple_b:
+            assert rank_a == rank_b, (tuple_a, rank_a, rank_b)
+        else:
+            assert rank_a < rank_b, (tuple_a, tuple_b, rank_a, rank_b)
+
+def test_two_card_hands_match_rank_tuples():
+    assert_same_order(list(itertools.combinations(CARDS, 2)))
+
+def test_five_card_hands_match_rank_tuples():
+    rng = random.Random(4)
+    hands = [rng.sample(CARDS, 5) for _ in range(20_000)]
+    # Straight flushes are too rare to turn up in the sample, so add them all
+    hands += [[CARDS[value << 2 | suit] for value in range(low, low + 5)]
+              for low in range(9) for suit in range(4)]
+    assert {PaiGowHand(cards).get_hand_rank()[0] for cards in hands} == set(range(9))
+    assert_same_order(hands)